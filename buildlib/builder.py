@@ -22,13 +22,14 @@ from buildlib.config import (
     SVG_INKSCAPE_CACHE,
     ProjectConfig,
     build_latexmk_command,
+    copy_file,
 )
 from buildlib.latex_errors import format_diagnostics, parse_latex_log
 from buildlib.mixins.cache import BuildCacheMixin
 from buildlib.mixins.cleanup import CleanupMixin
 from buildlib.mixins.discovery import DiscoveryMixin
 from buildlib.runner import CommandRunner
-from buildlib.ui import TerminalOutput
+from buildlib.ui import BufferedOutput, TerminalOutput
 
 # --- Rich library integration (conditional on RICH_AVAILABLE) ---
 if RICH_AVAILABLE:
@@ -45,35 +46,46 @@ if RICH_AVAILABLE:
     )
     from rich.text import Text
 
+
 # --- TQDM fallback ---
-try:
-    from tqdm import tqdm
-except ImportError:
-
-    class TqdmFallback:
-        def __init__(self, iterable, desc="", total=None):
-            self.iterable = iterable
-            self.desc = desc
-            try:
-                self.total = total or len(iterable)
-            except TypeError:
-                self.total = total  # generators/iterators don't support len()
-            self.current = 0
-
-        def __iter__(self):
-            for item in self.iterable:
-                self.current += 1
-                percent = (
-                    int((self.current / self.total) * 100) if self.total > 0 else 0
-                )
-                bar = "#" * (percent // 5) + "-" * (20 - (percent // 5))
-                sys.stdout.write(f"\r{self.desc}: [{bar}] {self.current}/{self.total} ")
-                sys.stdout.flush()
-                yield item
-            sys.stdout.write("\n")
+class TqdmFallback:
+    def __init__(self, iterable, desc="", total=None):
+        self.iterable = iterable
+        self.desc = desc
+        try:
+            self.total = total or len(iterable)
+        except TypeError:
+            self.total = total  # generators/iterators don't support len()
+        self.current = 0
+
+    def __iter__(self):
+        for item in self.iterable:
+            self.current += 1
+            percent = int((self.current / self.total) * 100) if self.total > 0 else 0
+            bar = "#" * (percent // 5) + "-" * (20 - (percent // 5))
+            sys.stdout.write(f"\r{self.desc}: [{bar}] {self.current}/{self.total} ")
             sys.stdout.flush()
+            yield item
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+
+# tqdm is imported on first use: it is only needed for the plain concurrent
+# build progress bar, not for listing, cleaning or preflight.
+tqdm = None
+
+
+def _get_tqdm():
+    """Return tqdm, or TqdmFallback when it is not installed."""
+    global tqdm
+    if tqdm is None:
+        try:
+            from tqdm import tqdm as _tqdm
+        except ImportError:
+            _tqdm = TqdmFallback
+        tqdm = _tqdm
+    return tqdm
 
-    tqdm = TqdmFallback
 
 # -----------------------------------------------------------------------------
 # Log Parsing for Package Timing
@@ -170,6 +182,53 @@ def parse_errors_from_log(example_dir: Path) -> str:
         return ""
 
 
+def read_fls_inputs(fls_path: Path, root_dir: Path) -> list[Path]:
+    """Return the project files a build read, from latexmk's .fls recorder file.
+
+    Only inputs under *root_dir* are kept: TeX distribution files are not
+    tracked, and neither are files the run wrote itself (aux, toc, ...).
+    """
+    try:
+        content = fls_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    inputs: dict[Path, None] = {}
+    outputs: set[Path] = set()
+    for line in content.splitlines():
+        kind, _, name = line.partition(" ")
+        if kind not in ("INPUT", "OUTPUT"):
+            continue
+        path = Path(os.path.normpath(root_dir / name))
+        if not path.is_relative_to(root_dir):
+            continue
+        if kind == "INPUT":
+            inputs[path] = None
+        else:
+            outputs.add(path)
+    return [p for p in inputs if p not in outputs]
+
+
+_BCF_DATASOURCE_RE = re.compile(r"<bcf:datasource\b[^>]*>([^<]+)</bcf:datasource>")
+
+
+def read_bcf_datasources(bcf_path: Path, root_dir: Path) -> list[Path]:
+    """Return the bibliography files biber reads, from biblatex's .bcf file.
+
+    biber opens these itself, so they never appear in the .fls recorder
+    file. Only existing files under *root_dir* are kept.
+    """
+    try:
+        content = bcf_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    sources: dict[Path, None] = {}
+    for name in _BCF_DATASOURCE_RE.findall(content):
+        path = Path(os.path.normpath(root_dir / name.strip()))
+        if path.is_relative_to(root_dir) and path.is_file():
+            sources[path] = None
+    return list(sources)
+
+
 # -----------------------------------------------------------------------------
 # Build Core Mixin
 # -----------------------------------------------------------------------------
@@ -246,18 +305,15 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                 cwd=example_dir,
             )
 
-        for cache_dir in (
-            Path(MINTED_CACHE_SUBDIR),
-            Path(SVG_INKSCAPE_CACHE),
-        ):
+        # One mkdir per cache dir; _minted was previously created twice.
+        for cache_dir in (MINTED_CACHE_SUBDIR, SVG_INKSCAPE_CACHE):
             (example_dir / cache_dir).mkdir(parents=True, exist_ok=True)
 
-        minted_cache_dir = example_dir / MINTED_CACHE_SUBDIR
-        minted_cache_dir.mkdir(parents=True, exist_ok=True)
-
+        # One realpath walk per example; the minted dir is derived from it.
+        example_root = example_dir.resolve()
         extra_env = {
-            "MINTED_CACHE_DIR": str(minted_cache_dir.resolve()),
-            "OMNILATEX_EXAMPLE_ROOT": str(example_dir.resolve()),
+            "MINTED_CACHE_DIR": str(example_root / MINTED_CACHE_SUBDIR),
+            "OMNILATEX_EXAMPLE_ROOT": str(example_root),
             "TEXINPUTS": os.pathsep.join([".", str(repo_root), ""]),
             "LC_ALL": "C.utf8",
         }
@@ -278,27 +334,35 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         src_pdf = example_dir / "main.pdf"
         all_logs.append(f"[DEBUG] Checking for PDF at: {src_pdf}")
 
-        if not src_pdf.exists():
+        # One stat() answers both "does it exist" and "how big is it".
+        try:
+            src_size = src_pdf.stat().st_size
+        except FileNotFoundError:
             all_logs.append(
                 "[bold red]✗ FAILURE: PDF not found at "
                 f"{src_pdf} after build attempt.[/bold red]"
             )
             return False, all_logs, 0
 
-        all_logs.append("[DEBUG] PDF exists, size: " f"{src_pdf.stat().st_size} bytes")
+        all_logs.append(f"[DEBUG] PDF exists, size: {src_size} bytes")
         dest_pdf = build_examples_dir / f"{example_name}.pdf"
         all_logs.append(f"[DEBUG] Destination PDF: {dest_pdf}")
 
         try:
-            shutil.copy(src_pdf, dest_pdf)
+            copy_file(src_pdf, dest_pdf)
             # Preserve .log file for content validation tests
-            src_log = example_dir / "main.log"
-            if src_log.exists():
-                dest_log = build_examples_dir / f"{example_name}.log"
-                shutil.copy(src_log, dest_log)
+            try:
+                shutil.copyfile(
+                    example_dir / "main.log",
+                    build_examples_dir / f"{example_name}.log",
+                )
+            except FileNotFoundError:
+                pass
             all_logs.append("[DEBUG] Copy operation completed")
 
-            if not dest_pdf.exists():
+            try:
+                dest_size = dest_pdf.stat().st_size
+            except FileNotFoundError:
                 all_logs.append(
                     "[bold red]✗ FAILURE: Copy reported "
                     "success but destination PDF not "
@@ -307,12 +371,10 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                 return False, all_logs, 0
 
             all_logs.append(
-                "[DEBUG] Destination PDF "
-                "confirmed, size: "
-                f"{dest_pdf.stat().st_size} bytes"
+                f"[DEBUG] Destination PDF confirmed, size: {dest_size} bytes"
             )
             all_logs.append("[green]PDF found and copied to build directory.[/green]")
-            return True, all_logs, dest_pdf.stat().st_size
+            return True, all_logs, dest_size
 
         except (OSError, shutil.Error) as copy_exc:
             all_logs.append(f"[DEBUG] Copy exception: {copy_exc}")
@@ -340,6 +402,35 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         with self._timings_lock:
             self.timings_data.append(timing_record)
 
+    def _record_build(
+        self,
+        example_name: str,
+        source_files: list[Path],
+        pdf_size: int,
+        source_hash: str | None = None,
+    ) -> str:
+        """Record a successful build in the build cache; returns the source hash.
+
+        *source_hash* is computed from *source_files* unless the caller already
+        has it.
+        """
+        if source_hash is None:
+            source_hash = self._hash_for_paths(source_files)
+        with self._cache_lock:
+            if self._shared_build_cache is not None:
+                cache = self._shared_build_cache
+            else:
+                cache = self._load_build_cache()
+            cache[f"examples/{example_name}"] = {
+                "source_hash": source_hash,
+                "mtimes": self._get_mtimes(source_files),
+                "pdf_size": pdf_size,
+                "build_time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }
+            if self._shared_build_cache is None:
+                self._save_build_cache(cache)
+        return source_hash
+
     def _compile_example_worker(self, example_name: str) -> tuple[str, bool, list[str]]:
         """Worker function that faithfully reproduces the
         original script's logic. Success is determined ONLY
@@ -353,9 +444,17 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
             repo_root = self.repo_root
             example_dir = repo_root / "examples" / example_name
 
+            build_examples_dir = (
+                repo_root / self.config.build_dir / BUILD_EXAMPLES_SUBDIR
+            )
+
+            dest_pdf = build_examples_dir / f"{example_name}.pdf"
+            dest_log = build_examples_dir / f"{example_name}.log"
+            source_files, source_hash = None, None
             if not self.force:
                 source_files = self._collect_source_files(example_name)
-                if self._cache_hit(example_name, source_files):
+                hit, source_hash = self._cache_status(example_name, source_files)
+                if hit:
                     all_logs.append(
                         "[green]✓ Cache hit for "
                         f"{example_name}, skipping build.[/green]"
@@ -363,6 +462,21 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                     _timing_success = True
                     return example_name, True, all_logs
 
+                if source_hash is None:
+                    source_hash = self._hash_for_paths(source_files)
+                pdf_size = self._restore_artifact(source_hash, dest_pdf, dest_log)
+                if pdf_size:
+                    all_logs.append(
+                        f"[green]✓ Restored {example_name} from the artifact "
+                        "cache, skipping build.[/green]"
+                    )
+                    self._record_build(
+                        example_name, source_files, pdf_size, source_hash
+                    )
+                    _timing_success = True
+                    _timing_pdf_size = pdf_size
+                    return example_name, True, all_logs
+
             invoke, extra_env = self._setup_build_env(example_dir, repo_root)
 
             exit_code, logs_from_run = self.runner.run(
@@ -370,9 +484,6 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
             )
             all_logs.extend(logs_from_run)
 
-            build_examples_dir = (
-                repo_root / self.config.build_dir / BUILD_EXAMPLES_SUBDIR
-            )
             all_logs.append(f"[DEBUG] Build examples dir: {build_examples_dir}")
             build_examples_dir.mkdir(parents=True, exist_ok=True)
 
@@ -391,21 +502,14 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
             _timing_success = True
             _timing_pdf_size = pdf_size
 
-            source_files = self._collect_source_files(example_name)
-            source_hash = self._hash_for_paths(source_files)
-            with self._cache_lock:
-                if self._shared_build_cache is not None:
-                    cache = self._shared_build_cache
-                else:
-                    cache = self._load_build_cache()
-                cache[f"examples/{example_name}"] = {
-                    "source_hash": source_hash,
-                    "mtimes": self._get_mtimes(source_files),
-                    "pdf_size": pdf_size,
-                    "build_time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                }
-                if self._shared_build_cache is None:
-                    self._save_build_cache(cache)
+            # Inputs hashed before the build are reused; outputs latexmk wrote
+            # since are excluded from the input set anyway.
+            if source_files is None:
+                source_files = self._collect_source_files(example_name)
+            source_hash = self._record_build(
+                example_name, source_files, pdf_size, source_hash
+            )
+            self._store_artifact(source_hash, dest_pdf, dest_log)
             return example_name, True, all_logs
 
         except (OSError, ValueError) as exc:
@@ -493,7 +597,7 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                     _refresh_active_unlocked()
 
         results = []
-        with Live(layout, console=console, screen=True, refresh_per_second=10):
+        with Live(layout, console=console, screen=True, refresh_per_second=5):
             with ThreadPoolExecutor(max_workers=self.jobs) as executor:
                 futures = {}
                 for name in example_names:
@@ -501,7 +605,8 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                     futures[future] = name
                     with active_lock:
                         active_jobs[name] = time.perf_counter()
-                    _refresh_active()
+                # One rebuild for the whole queue, not one per submission.
+                _refresh_active()
 
                 for future in as_completed(futures):
                     name = futures[future]
@@ -516,9 +621,10 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                         results.append(False)
                         with completed_lock:
                             completed[name] = False
-                        log_lines.append(
-                            f"[b red]FATAL ERROR: " f"{name}: {exc}[/b red]"
-                        )
+                        with log_lock:
+                            log_lines.append(
+                                f"[b red]FATAL ERROR: " f"{name}: {exc}[/b red]"
+                            )
                     finally:
                         with active_lock:
                             active_jobs.pop(name, None)
@@ -538,11 +644,14 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
                 executor.submit(self._compile_example_worker, name): name
                 for name in example_names
             }
-            for future in tqdm(
-                as_completed(futures),
-                total=len(example_names),
-                desc="Building Examples",
-            ):
+            completed = as_completed(futures)
+            # Off a terminal every repaint becomes a log line; the per-example
+            # "Finished:" messages already report progress there.
+            if sys.stdout.isatty():
+                completed = _get_tqdm()(
+                    completed, total=len(example_names), desc="Building Examples"
+                )
+            for future in completed:
                 try:
                     name, success, logs = future.result()
                     results.append(success)
@@ -574,6 +683,9 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         """
         self.ui.header(f"Building examples (up to {self.jobs} in parallel)")
         all_names = [e.name for e in self.discover_examples()]
+        artifact_cap = max(
+            self.ARTIFACT_CACHE_MAX, len(all_names) * self.ARTIFACTS_PER_EXAMPLE
+        )
         names = all_names if not files else [n for n in files if n in all_names]
         if not names:
             self.ui.warning("No valid examples to build.")
@@ -581,7 +693,10 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
 
         self.ui.info(f"Queued {len(names)} example(s) for build.")
 
-        self._shared_build_cache = self._load_build_cache()
+        # Swapped in and out under the lock: build_all records the root
+        # build from another thread while the examples run.
+        with self._cache_lock:
+            self._shared_build_cache = self._load_build_cache()
         try:
             if RICH_AVAILABLE:
                 self._build_examples_rich_concurrent(names)
@@ -593,7 +708,8 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         finally:
             with self._cache_lock:
                 self._save_build_cache(self._shared_build_cache)
-            self._shared_build_cache = None
+                self._shared_build_cache = None
+            self._prune_artifacts(artifact_cap)
 
         if self.timings and self.timings_data:
             metrics_path = self.config.build_dir / "metrics.json"
@@ -630,48 +746,154 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         self.build_examples(files)
 
     def build_all(self, _: object | None = None) -> None:
-        """Build root document and all examples."""
-        self.build_root()
-        self.build_examples()
-
-    def build_root(self, _: object | None = None) -> None:
-        """Build the root document (main.tex)."""
-        self.ui.header("Building Root")
-        pdf_path = Path(MAIN_TEX_FILENAME).with_suffix(".pdf")
-
-        if RICH_AVAILABLE and not self.config.is_ci():
-            exit_code, logs = self._run_with_dashboard(
-                [LATEXMK_COMMAND, INTERACTION_NONSTOP, MAIN_TEX_FILENAME],
-                title="Building Root",
-            )
+        """Build root document and all examples.
+
+        The root document is built first, so a root failure stops the run
+        before the examples start. With the plain example display and more
+        than one job, the root build instead overlaps the examples: it takes
+        one job slot, and its messages are held back until the examples
+        finish so they do not cut into the progress bar. A root failure is
+        then raised after the examples.
+        """
+        if RICH_AVAILABLE or self.jobs <= 1:
+            self.build_root()
+            self.build_examples()
+            return
+        root_ui = BufferedOutput(self.ui)
+        jobs = self.jobs
+        self.jobs = jobs - 1
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                root = executor.submit(self.build_root, dashboard=False, ui=root_ui)
+                self.build_examples()
+        finally:
+            self.jobs = jobs
+            root_ui.replay()
+        root.result()
+
+    def build_root(
+        self,
+        _: object | None = None,
+        *,
+        dashboard: bool = True,
+        ui: TerminalOutput | None = None,
+    ) -> None:
+        """Build the root document (main.tex).
+
+        Messages go to *ui* when given (build_all buffers them), else ui.
+        """
+        ui = ui or self.ui
+        ui.header("Building Root")
+        # The root document lives at the repository root; pass it explicitly
+        # so the build never depends on the process working directory.
+        root_dir = self.repo_root
+        pdf_path = root_dir / Path(MAIN_TEX_FILENAME).with_suffix(".pdf")
+
+        if not self.force and self._root_up_to_date(pdf_path):
+            ui.info("Root document is up to date, skipping latexmk.")
+            exit_code, logs = 0, []
         else:
-            exit_code, logs = self.runner.run(
-                [LATEXMK_COMMAND, INTERACTION_NONSTOP, MAIN_TEX_FILENAME]
-            )
+            command = [LATEXMK_COMMAND, INTERACTION_NONSTOP, MAIN_TEX_FILENAME]
+            if dashboard and RICH_AVAILABLE and not self.config.is_ci():
+                exit_code, logs = self._run_with_dashboard(
+                    command, title="Building Root", cwd=root_dir
+                )
+            else:
+                exit_code, logs = self.runner.run(command, cwd=root_dir)
+            if exit_code == 0 and pdf_path.exists():
+                self._record_root_build(root_dir, pdf_path)
 
         if pdf_path.exists():
-            self.ui.success("Root build complete.")
-            build_dir = self.config.build_dir
+            ui.success("Root build complete.")
+            build_dir = root_dir / self.config.build_dir
             build_dir.mkdir(parents=True, exist_ok=True)
             shutil.copy(pdf_path, build_dir / pdf_path.name)
-            self.ui.success(f"Copied {pdf_path.name} to {build_dir}")
+            ui.success(f"Copied {pdf_path.name} to {build_dir}")
         else:
-            self.ui.error("Build failure: PDF not generated.")
+            ui.error("Build failure: PDF not generated.")
             if exit_code != 0:
-                self.ui.error(f"latexmk exited with code {exit_code}")
+                ui.error(f"latexmk exited with code {exit_code}")
             # Parse and display actionable error messages
-            parsed = parse_errors_from_log(Path("."))
+            parsed = parse_errors_from_log(root_dir)
             if parsed:
-                print(parsed)
+                ui.plain(parsed)
             else:
                 # Fallback: print raw logs
                 tail = logs[-50:] if len(logs) > 50 else logs
                 for line in tail:
-                    print(line)
+                    ui.plain(line)
             raise SystemExit(1)
 
+    def _root_up_to_date(self, pdf_path: Path) -> bool:
+        """Check whether the recorded inputs of the last root build are unchanged.
+
+        Uses the "root" entry of the build cache, written by
+        _record_root_build. The PDF itself must also be the one that build
+        produced, and the build mode and CNF lines must match.
+        """
+        with self._cache_lock:
+            if self._shared_build_cache is not None:
+                cache = self._shared_build_cache
+            else:
+                cache = self._load_build_cache()
+            cached = cache.get("root")
+        if not cached or cached.get("build_config") != self._root_build_config():
+            return False
+        try:
+            if pdf_path.stat().st_mtime != cached.get("pdf_mtime"):
+                return False
+        except OSError:
+            return False
+
+        cached_mtimes = cached.get("mtimes") or {}
+        inputs = [Path(p) for p in cached_mtimes]
+        current_mtimes = self._get_mtimes(inputs)
+        if not inputs or len(current_mtimes) != len(inputs):
+            return False  # nothing recorded, or an input was deleted
+        if current_mtimes == cached_mtimes:
+            return True
+        return self._hash_for_paths(inputs) == cached.get("source_hash")
+
+    def _record_root_build(self, root_dir: Path, pdf_path: Path) -> None:
+        """Record the inputs of a successful root build.
+
+        TeX's inputs come from main.fls. biber's .bib files are read from
+        main.bcf and the root .latexmkrc is added, since neither is opened
+        by the TeX engine.
+        """
+        main = root_dir / MAIN_TEX_FILENAME
+        inputs = read_fls_inputs(main.with_suffix(".fls"), root_dir)
+        if not inputs:
+            return
+        inputs += read_bcf_datasources(main.with_suffix(".bcf"), root_dir)
+        latexmkrc = root_dir / ".latexmkrc"
+        if latexmkrc.is_file():
+            inputs.append(latexmkrc)
+        inputs = list(dict.fromkeys(inputs))
+        with self._cache_lock:
+            if self._shared_build_cache is not None:
+                cache = self._shared_build_cache
+            else:
+                cache = self._load_build_cache()
+            cache["root"] = {
+                "source_hash": self._hash_for_paths(inputs),
+                "mtimes": self._get_mtimes(inputs),
+                "pdf_mtime": pdf_path.stat().st_mtime,
+                "build_config": self._root_build_config(),
+                "build_time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }
+            if self._shared_build_cache is None:
+                self._save_build_cache(cache)
+
+    def _root_build_config(self) -> list[str]:
+        return [self.runner.build_mode, *(self.config.cnf_lines or ())]
+
     def _run_with_dashboard(
-        self, cmd_args: list[str], *, title: str = "Building"
+        self,
+        cmd_args: list[str],
+        *,
+        title: str = "Building",
+        cwd: Path | None = None,
     ) -> tuple[int, list[str]]:
         """Run a command with a rich live dashboard showing progress and logs."""
         console = Console()
@@ -716,7 +938,7 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         logs: list[str] = []
         try:
             with Live(layout, console=console, refresh_per_second=5):
-                exit_code, logs = self.runner.run(cmd_args, on_line=on_line)
+                exit_code, logs = self.runner.run(cmd_args, cwd=cwd, on_line=on_line)
                 elapsed = time.perf_counter() - start_time
                 if exit_code == 0:
                     status_table.rows[0].cells[1] = Text("[green]✓ Complete[/green]")
@@ -728,7 +950,7 @@ class _BuildCore(BuildCacheMixin, DiscoveryMixin, CleanupMixin):
         except Exception as exc:
             # Dashboard failed, fall back to simple run
             self.ui.warning(f"Dashboard error ({exc}), falling back to simple output.")
-            return self.runner.run(cmd_args)
+            return self.runner.run(cmd_args, cwd=cwd)
 
         return exit_code, logs
 
@@ -96,14 +96,48 @@ _LAMBDA_COMMANDS = frozenset(
     {"export", "plugin-search", "plugin-install", "plugin-remove", "plugin-info"}
 )
 
+# Plugin commands taking a positional plugin name, resolved once at import.
+_PLUGIN_NAME_COMMANDS = frozenset({"plugin-install", "plugin-remove", "plugin-info"})
+
+
+# Top-level options that consume the next argv token as their value.
+_VALUE_OPTIONS = frozenset(
+    {"--mode", "--source-date-epoch", "-j", "--jobs", "--cnf-line"}
+)
+
 
 # ---------------------------------------------------------------------------
 # Parser construction
 # ---------------------------------------------------------------------------
 
 
-def _create_parser(default_jobs: int) -> argparse.ArgumentParser:
-    """Build the full argument parser with all subcommands."""
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in *argv*, or None if it is not obvious.
+
+    Anything unusual (abbreviated options, help, unknown names) returns None
+    so the caller falls back to the full parser and its error messages.
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _VALUE_OPTIONS:
+            next(tokens, None)
+        elif token.startswith("-"):
+            if token in ("-h", "--help"):
+                return None
+        else:
+            return token if token in _COMMANDS else None
+    return None
+
+
+def _create_parser(
+    default_jobs: int, only: str | None = None
+) -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands, or just *only*.
+
+    Registering every subparser costs a few milliseconds per invocation;
+    when the command is already known from argv, only its own subparser
+    is built. Top-level help and unknown commands get the full parser.
+    """
     parser = argparse.ArgumentParser(
         description="OmniLaTeX build tool.",
         formatter_class=argparse.RawTextHelpFormatter,
@@ -150,6 +184,8 @@ def _create_parser(default_jobs: int) -> argparse.ArgumentParser:
     subparser_map: dict[str, argparse.ArgumentParser] = {}
 
     for name, (handler, help_text, takes_files) in _COMMANDS.items():
+        if only is not None and name != only:
+            continue
         sub = subparsers.add_parser(name, help=help_text)
         sub.set_defaults(handler=handler)
         if takes_files:
@@ -157,7 +193,7 @@ def _create_parser(default_jobs: int) -> argparse.ArgumentParser:
         subparser_map[name] = sub
 
         # Plugin subcommand arguments
-        if name in ("plugin-install", "plugin-remove", "plugin-info"):
+        if name in _PLUGIN_NAME_COMMANDS:
             sub.add_argument("plugin_name", type=str, help="Plugin name.")
         if name == "plugin-search":
             sub.add_argument(
@@ -169,69 +205,85 @@ def _create_parser(default_jobs: int) -> argparse.ArgumentParser:
             )
 
     # diff-specific arguments
-    subparser_map["diff"].add_argument(
-        "--regenerate-references",
-        action="store_true",
-        dest="regenerate_references",
-        default=False,
-        help="Copy built PDFs to tests/references/ as new baselines instead of comparing.",
-    )
-    subparser_map["diff"].add_argument(
-        "--output",
-        "-o",
-        type=str,
-        default=None,
-        metavar="PATH",
-        help="Output path for annotated diff PDF (used with two-PDF or git-ref mode).",
-    )
+    if "diff" in subparser_map:
+        subparser_map["diff"].add_argument(
+            "--regenerate-references",
+            action="store_true",
+            dest="regenerate_references",
+            default=False,
+            help=(
+                "Copy built PDFs to tests/references/ as new baselines "
+                "instead of comparing."
+            ),
+        )
+        subparser_map["diff"].add_argument(
+            "--output",
+            "-o",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help=(
+                "Output path for annotated diff PDF "
+                "(used with two-PDF or git-ref mode)."
+            ),
+        )
 
     # init-specific arguments
-    subparser_map["init"].add_argument(
-        "--doctype",
-        type=str,
-        default=None,
-        help="Document type (e.g. book, thesis, article, poster, presentation, letter)",
-    )
-    subparser_map["init"].add_argument(
-        "--institution",
-        type=str,
-        default=None,
-        help="Institution config name (e.g. tum, eth, none)",
-    )
-    subparser_map["init"].add_argument(
-        "--language",
-        type=str,
-        default=None,
-        help="Document language (e.g. english, german, chinese)",
-    )
-    subparser_map["init"].add_argument(
-        "--thesis",
-        action="store_true",
-        default=False,
-        help="Shortcut: set doctype=thesis and create full thesis project structure.",
-    )
+    if "init" in subparser_map:
+        subparser_map["init"].add_argument(
+            "--doctype",
+            type=str,
+            default=None,
+            help=(
+                "Document type "
+                "(e.g. book, thesis, article, poster, presentation, letter)"
+            ),
+        )
+        subparser_map["init"].add_argument(
+            "--institution",
+            type=str,
+            default=None,
+            help="Institution config name (e.g. tum, eth, none)",
+        )
+        subparser_map["init"].add_argument(
+            "--language",
+            type=str,
+            default=None,
+            help="Document language (e.g. english, german, chinese)",
+        )
+        subparser_map["init"].add_argument(
+            "--thesis",
+            action="store_true",
+            default=False,
+            help=(
+                "Shortcut: set doctype=thesis and create full thesis "
+                "project structure."
+            ),
+        )
 
     # export-specific arguments
-    subparser_map["export"].add_argument(
-        "--format",
-        "-f",
-        dest="export_format",
-        type=str,
-        default="html",
-        choices=["html", "html5", "epub", "epub3", "docx", "md"],
-        help="Output format (default: html)",
-    )
+    if "export" in subparser_map:
+        subparser_map["export"].add_argument(
+            "--format",
+            "-f",
+            dest="export_format",
+            type=str,
+            default="html",
+            choices=["html", "html5", "epub", "epub3", "docx", "md"],
+            help="Output format (default: html)",
+        )
 
     # list-examples-specific arguments
-    subparser_map["list-examples"].add_argument(
-        "--format",
-        "-f",
-        dest="list_format",
-        type=str,
-        default="text",
-        choices=["text", "json"],
-        help="Output format (default: text)",
-    )
+    if "list-examples" in subparser_map:
+        subparser_map["list-examples"].add_argument(
+            "--format",
+            "-f",
+            dest="list_format",
+            type=str,
+            default="text",
+            choices=["text", "json"],
+            help="Output format (default: text)",
+        )
 
     return parser
 
@@ -293,6 +345,8 @@ def _dispatch_command(
 
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        ui.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -300,11 +354,19 @@ def _dispatch_command(
 # ---------------------------------------------------------------------------
 
 
+def _available_cpus() -> int:
+    """CPUs this process may run on (affinity/cgroup aware where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 4
+
+
 def main() -> None:
     ui, config = TerminalOutput(), ProjectConfig()
-    default_jobs = 4 if config.is_ci() else (os.cpu_count() or 4)
+    in_ci = config.is_ci()
+    default_jobs = 4 if in_ci else _available_cpus()
 
-    parser = _create_parser(default_jobs)
+    parser = _create_parser(default_jobs, only=_requested_command(sys.argv[1:]))
     args = parser.parse_args()
 
     if args.source_date_epoch is not None:
@@ -322,7 +384,7 @@ def main() -> None:
 
     # No command given — show interactive menu (TTY) or help (CI)
     if not args.command:
-        if config.is_ci() or not sys.stdout.isatty():
+        if in_ci or not sys.stdout.isatty():
             parser.print_help()
             return
         interactive_menu(tasks, _COMMANDS)
@@ -5,14 +5,33 @@ Provides cross-reference integrity checking and LaTeX linting.
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import subprocess
 from collections import defaultdict
 from pathlib import Path
+from typing import Iterator
 
 import buildlib.config as _cfg
 
+# Directories that never hold project sources; pruned before descending.
+_PRUNED_DIRS = frozenset(
+    {".git", "node_modules", ".venv", "__pycache__", _cfg.SVG_INKSCAPE_CACHE}
+)
+
+# Cross-reference patterns run over raw bytes: the commands are ASCII and no
+# UTF-8 multibyte sequence contains "}" or ",", so only the captured keys
+# need decoding, not whole files.
+_LABEL_RE = re.compile(rb"\\label\{([^}]+)\}")
+_REF_RE = re.compile(rb"\\(?:ref|eqref|autoref|cref|Cref|pageref)\{([^}]+)\}")
+_CITE_RE = re.compile(rb"\\(?:cite|nocite)\{([^}]+)\}")
+_BIB_ENTRY_RE = re.compile(rb"@\w+\{([^,\s]+),")
+
+
+def _decode_key(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace")
+
 
 class CheckLintMixin:
     """Mixin providing check and lint commands.
@@ -20,6 +39,32 @@ class CheckLintMixin:
     Requires self.ui, self.config to be set by the inheriting class.
     """
 
+    def _iter_tex_sources(self, root: Path, suffix: str = ".tex") -> Iterator[Path]:
+        """Yield files ending in *suffix* under *root*, skipping build output.
+
+        Walks with os.walk and prunes the build directory, minted caches and
+        _PRUNED_DIRS in place, so those trees are never listed at all.
+        """
+        # config.build_dir is usually relative to the repo while *root* is
+        # absolute; resolve both once and express the build dir as a path
+        # under *root*, so it compares equal to os.walk's joined paths.
+        build_dir = (_cfg.REPO_ROOT / self.config.build_dir).resolve()
+        try:
+            build_dir = root / build_dir.relative_to(root.resolve())
+        except ValueError:
+            build_dir = None  # build output lies outside the scanned tree
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if d not in _PRUNED_DIRS
+                and not d.startswith(_cfg.MINTED_CACHE_SUBDIR)
+                and Path(dirpath, d) != build_dir
+            ]
+            for name in filenames:
+                if name.endswith(suffix):
+                    yield Path(dirpath, name)
+
     def cmd_check(self, files: list[str] | None = None) -> int:
         """Cross-reference integrity check on LaTeX files."""
         self.ui.header("Cross-Reference Integrity Check")
@@ -30,14 +75,8 @@ class CheckLintMixin:
             self.ui.error(f"Not a directory: {scan_dir}")
             return 1
 
-        tex_files = sorted(
-            f
-            for f in scan_dir.rglob("*.tex")
-            if self.config.build_dir not in f.parents and "_minted" not in str(f)
-        )
-        bib_files = sorted(
-            f for f in scan_dir.rglob("*.bib") if self.config.build_dir not in f.parents
-        )
+        tex_files = sorted(self._iter_tex_sources(scan_dir))
+        bib_files = sorted(self._iter_tex_sources(scan_dir, ".bib"))
 
         if not tex_files:
             self.ui.warning(f"No .tex files found in {scan_dir}")
@@ -47,11 +86,6 @@ class CheckLintMixin:
             f"Scanning {len(tex_files)} .tex file(s), {len(bib_files)} .bib file(s)"
         )
 
-        _LABEL_RE = re.compile(r"\\label\{([^}]+)\}")
-        _REF_RE = re.compile(r"\\(?:ref|eqref|autoref|cref|Cref|pageref)\{([^}]+)\}")
-        _CITE_RE = re.compile(r"\\(?:cite|nocite)\{([^}]+)\}")
-        _BIB_ENTRY_RE = re.compile(r"@\w+\{([^,\s]+),")
-
         labels: dict[str, list[str]] = defaultdict(list)
         refs: dict[str, list[str]] = defaultdict(list)
         cites: dict[str, list[str]] = defaultdict(list)
@@ -59,36 +93,38 @@ class CheckLintMixin:
 
         for tex in tex_files:
             try:
-                content = tex.read_text(encoding="utf-8", errors="replace")
+                content = tex.read_bytes()
             except OSError as exc:
                 self.ui.warning(f"Cannot read {tex}: {exc}")
                 continue
 
-            rel = tex.relative_to(scan_dir) if tex.is_relative_to(scan_dir) else tex
+            rel = str(
+                tex.relative_to(scan_dir) if tex.is_relative_to(scan_dir) else tex
+            )
 
             for m in _LABEL_RE.finditer(content):
-                labels[m.group(1)].append(str(rel))
+                labels[_decode_key(m.group(1))].append(rel)
 
             for m in _REF_RE.finditer(content):
-                for key in m.group(1).split(","):
+                for key in _decode_key(m.group(1)).split(","):
                     key = key.strip()
                     if key:
-                        refs[key].append(str(rel))
+                        refs[key].append(rel)
 
             for m in _CITE_RE.finditer(content):
-                for key in m.group(1).split(","):
+                for key in _decode_key(m.group(1)).split(","):
                     key = key.strip()
                     if key:
-                        cites[key].append(str(rel))
+                        cites[key].append(rel)
 
         for bib in bib_files:
             try:
-                content = bib.read_text(encoding="utf-8", errors="replace")
+                content = bib.read_bytes()
             except OSError as exc:
                 self.ui.warning(f"Cannot read {bib}: {exc}")
                 continue
             for m in _BIB_ENTRY_RE.finditer(content):
-                bib_keys.add(m.group(1))
+                bib_keys.add(_decode_key(m.group(1)))
 
         label_set = set(labels.keys())
         ref_set = set(refs.keys())
@@ -149,11 +185,7 @@ class CheckLintMixin:
         if files:
             tex_files = [Path(f) for f in files if Path(f).exists()]
         else:
-            tex_files = sorted(
-                f
-                for f in repo_root.rglob("*.tex")
-                if self.config.build_dir not in f.parents and "_minted" not in str(f)
-            )
+            tex_files = sorted(self._iter_tex_sources(repo_root))
 
         if not tex_files:
             self.ui.warning("No .tex files found")
@@ -4,11 +4,14 @@ scaffold, init, doctor, check, lint, export."""
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import buildlib.config as _cfg
@@ -186,30 +189,60 @@ class _Commands(
 
     # -- preflight ----------------------------------------------------------
 
-    def cmd_preflight(self, files: list[str] | None = None) -> None:
-        """Validate build environment readiness."""
-        checks = []
+    # A fully passing preflight is reused for this many seconds as long as
+    # the toolchain fingerprint is unchanged.
+    PREFLIGHT_CACHE_TTL = 600
 
-        checks.append(self._check_tool("lualatex", "LuaTeX engine"))
-        checks.append(self._check_tool("latexmk", "latexmk build tool"))
+    def _preflight_fingerprint(self) -> str:
+        """Hash the platform, interpreter, TEXINPUTS and resolved tool paths."""
+        parts = [sys.platform, sys.version, os.environ.get("TEXINPUTS", "")]
+        parts += [
+            shutil.which(tool) or ""
+            for tool in ("lualatex", "latexmk", "tex", "kpsewhich", "inkscape", "git")
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
 
-        checks.append(
-            ("Python >= 3.10", sys.version_info >= (3, 10), f"Found {sys.version}")
-        )
+    def _preflight_cache_path(self) -> Path:
+        return _cfg.REPO_ROOT / self.config.build_dir / "preflight_cache.json"
 
-        checks.append(
-            self._check_tool("inkscape", "Inkscape (SVG support)", required=False)
-        )
-        checks.append(self._check_tool("git", "Git CLI"))
+    def _load_preflight_cache(self, fingerprint: str) -> dict | None:
+        cache_path = self._preflight_cache_path()
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return None
+        age = time.time() - data.get("timestamp", 0)
+        if not 0 <= age < self.PREFLIGHT_CACHE_TTL:
+            return None
+        return data
 
-        tex_version = self._get_texlive_version()
-        checks.append(
-            (
-                "TeX Live >= 2024",
-                tex_version is not None and tex_version >= 2024,
-                f"Found TeX Live {tex_version or 'unknown'}",
-            )
-        )
+    def _save_preflight_cache(self, fingerprint: str, total: int) -> None:
+        cache_path = self._preflight_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "fingerprint": fingerprint,
+                "timestamp": time.time(),
+                "total": total,
+            }
+            cache_path.write_text(json.dumps(data), encoding="utf-8")
+        except OSError:
+            pass
+
+    def cmd_preflight(self, files: list[str] | None = None) -> None:
+        """Validate build environment readiness.
+
+        A fully passing result is cached in build/preflight_cache.json and
+        reused for PREFLIGHT_CACHE_TTL seconds, skipping the tex and
+        kpsewhich probes, unless the toolchain fingerprint changes.
+        """
+        fingerprint = self._preflight_fingerprint()
+        cached = self._load_preflight_cache(fingerprint)
+        if cached is not None:
+            self.ui.success(f"All {cached.get('total', 0)} checks passed (cached)")
+            return
 
         packages = [
             "fontspec",
@@ -221,7 +254,38 @@ class _Commands(
             "circuitikz",
             "forest",
         ]
-        pkg_results = self._check_all_latex_packages(packages)
+
+        # tex --version and kpsewhich are independent; run them side by side
+        # while the PATH lookups below proceed.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            tex_future = pool.submit(self._get_texlive_version)
+            pkg_future = pool.submit(self._check_all_latex_packages, packages)
+
+            checks = []
+
+            checks.append(self._check_tool("lualatex", "LuaTeX engine"))
+            checks.append(self._check_tool("latexmk", "latexmk build tool"))
+
+            checks.append(
+                ("Python >= 3.10", sys.version_info >= (3, 10), f"Found {sys.version}")
+            )
+
+            checks.append(
+                self._check_tool("inkscape", "Inkscape (SVG support)", required=False)
+            )
+            checks.append(self._check_tool("git", "Git CLI"))
+
+            tex_version = tex_future.result()
+            pkg_results = pkg_future.result()
+
+        checks.append(
+            (
+                "TeX Live >= 2024",
+                tex_version is not None and tex_version >= 2024,
+                f"Found TeX Live {tex_version or 'unknown'}",
+            )
+        )
+
         for pkg in packages:
             found = pkg_results[pkg]
             checks.append((f"Package {pkg}", found, "Found" if found else "Missing"))
@@ -234,6 +298,7 @@ class _Commands(
 
         if passed == total:
             self.ui.success(f"All {total} checks passed")
+            self._save_preflight_cache(fingerprint, total)
         else:
             self.ui.warning(f"{passed}/{total} checks passed")
 
@@ -14,7 +14,7 @@ from pathlib import Path
 class DoctorMixin:
     """Mixin providing the doctor command.
 
-    Requires self.ui to be set by the inheriting class.
+    Requires self.ui, self.runner to be set by the inheriting class.
     """
 
     def cmd_doctor(self, _: list[str] | None = None) -> None:
@@ -69,29 +69,21 @@ class DoctorMixin:
 
         font_results: dict[str, tuple[bool, str]] = {}
 
-        fc_list_output = ""
-        try:
-            result = subprocess.run(
-                ["fc-list", ":family"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                fc_list_output = result.stdout.lower()
-        except (subprocess.TimeoutExpired, OSError):
-            import logging
-
-            logging.getLogger("omnilatex").debug(
-                "fc-list font detection failed", exc_info=True
-            )
+        # fc-list can print thousands of families; stream it and stop as soon
+        # as every font we care about has been seen.
+        fc_list_found = self.runner.run_grep(
+            ["fc-list", ":family"],
+            [fn.lower().encode() for fn in font_names],
+            ignore_case=True,
+            timeout=10,
+        )
 
         lualatex_check_done = False
 
         for font_name in font_names:
             found = None
 
-            if font_name.lower() in fc_list_output:
+            if font_name.lower().encode() in fc_list_found:
                 found = True
 
             if found is None and not lualatex_check_done:
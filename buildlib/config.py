@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import shutil
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -21,6 +23,11 @@ MINTED_CACHE_SUBDIR = "_minted"
 SVG_INKSCAPE_CACHE = "svg-inkscape"
 BUILD_EXAMPLES_SUBDIR = "examples"
 
+# Environment lookups used by ProjectConfig, hoisted so they are not rebuilt
+# on every call.
+_CI_ENV_VARS = ("CI", "GITHUB_ACTIONS", "GITLAB_CI")
+_TRUTHY = frozenset({"1", "true", "yes"})
+
 # Repository root directory (two levels up from this file: buildlib/ -> repo root)
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
@@ -47,11 +54,11 @@ class ProjectConfig:
 
     def is_ci(self) -> bool:
         """Return True if running in a CI environment."""
-        return any(os.environ.get(var) for var in ["CI", "GITHUB_ACTIONS", "GITLAB_CI"])
+        return any(os.environ.get(var) for var in _CI_ENV_VARS)
 
     def verbose_enabled(self) -> bool:
         """Return True if verbose logging is enabled via environment."""
-        return os.environ.get("OMNILATEX_VERBOSE", "0").lower() in {"1", "true", "yes"}
+        return os.environ.get("OMNILATEX_VERBOSE", "0").lower() in _TRUTHY
 
 
 def base_build_env() -> dict[str, str]:
@@ -66,6 +73,50 @@ def base_build_env() -> dict[str, str]:
     }
 
 
+def find_example_dirs(examples_dir: Path) -> list[Path]:
+    """Return sorted example directories under *examples_dir* with a main.tex.
+
+    Uses a single ``os.scandir`` pass: directory type comes from the cached
+    dirent, leaving one ``isfile`` probe per candidate. Shared by builder.py
+    and profiler.py.
+    """
+    found: list[Path] = []
+    try:
+        with os.scandir(examples_dir) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.isfile(
+                    os.path.join(entry.path, MAIN_TEX_FILENAME)
+                ):
+                    found.append(Path(entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    found.sort()
+    return found
+
+
+# FICLONE from <linux/fs.h>: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst*, as a reflink where the filesystem supports it.
+
+    On copy-on-write filesystems (Btrfs, XFS, bcachefs) the FICLONE ioctl
+    shares extents instead of copying bytes; elsewhere this falls back to
+    ``shutil.copyfile``. Used to publish and cache built PDFs.
+    """
+    if sys.platform == "linux":
+        try:
+            import fcntl
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
 def build_latexmk_command(
     force_rebuild: bool = False,
     include_root_rc: bool = False,
@@ -11,27 +11,58 @@ import hashlib
 import json
 import logging
 import os
+import shutil
+import tempfile
 from pathlib import Path
 
 import buildlib.config as _cfg
 
 logger = logging.getLogger("omnilatex")
 
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 class BuildCacheMixin:
     """Mixin providing build cache operations.
 
-    Requires self.config, self._cache_lock, self._shared_build_cache
-    to be set by the inheriting class.
+    Requires self.config, self.runner, self._cache_lock,
+    self._shared_build_cache to be set by the inheriting class.
     """
 
+    # Built PDFs are also kept content-addressed under build/cache/, so that
+    # returning to an earlier source state (e.g. switching branches) restores
+    # the matching PDF without running latexmk. After each build_examples run
+    # the oldest artifacts are pruned down to the larger of ARTIFACT_CACHE_MAX
+    # and ARTIFACTS_PER_EXAMPLE per discovered example (one per build mode).
+    ARTIFACT_CACHE_MAX = 200
+    ARTIFACTS_PER_EXAMPLE = 3
+
     @staticmethod
     def _hash_for_paths(paths: list[Path]) -> str:
-        """Compute SHA-256 hash of all file contents, sorted by path."""
+        """Compute SHA-256 hash of all file paths and contents, sorted by path.
+
+        Each file contributes its repo-relative path and size before its
+        bytes, so renaming or moving a file changes the digest. Contents are
+        streamed through one reusable buffer, so large images add no
+        per-file allocations.
+        """
         h = hashlib.sha256()
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        root = _cfg.REPO_ROOT
         for p in sorted(paths):
-            if p.exists():
-                h.update(p.read_bytes())
+            try:
+                with open(p, "rb", buffering=0) as f:
+                    try:
+                        name = p.relative_to(root).as_posix()
+                    except ValueError:
+                        name = p.as_posix()
+                    size = os.fstat(f.fileno()).st_size
+                    h.update(f"{name}\0{size}\0".encode())
+                    while n := f.readinto(buf):
+                        h.update(view[:n])
+            except FileNotFoundError:
+                continue
         return h.hexdigest()
 
     @staticmethod
@@ -39,8 +70,10 @@ class BuildCacheMixin:
         """Get modification times for all paths. Used for fast cache checks."""
         mtimes: dict[str, float] = {}
         for p in paths:
-            if p.exists():
+            try:
                 mtimes[str(p)] = p.stat().st_mtime
+            except OSError:
+                continue
         return mtimes
 
     def _cache_hit(self, example_name: str, source_files: list[Path]) -> bool:
@@ -50,6 +83,15 @@ class BuildCacheMixin:
         the cached mtimes, and the output PDF exists. This avoids reading
         every file to compute the full SHA-256 hash when nothing changed.
         """
+        return self._cache_status(example_name, source_files)[0]
+
+    def _cache_status(
+        self, example_name: str, source_files: list[Path]
+    ) -> tuple[bool, str | None]:
+        """Like :meth:`_cache_hit`, also returning the source hash if computed.
+
+        Callers reuse the hash on a miss instead of reading the sources again.
+        """
         with self._cache_lock:
             if self._shared_build_cache is not None:
                 cache = self._shared_build_cache
@@ -58,24 +100,97 @@ class BuildCacheMixin:
             cached = cache.get(f"examples/{example_name}")
 
         if not cached:
-            return False
+            return False, None
+
+        dest_pdf = (
+            _cfg.REPO_ROOT / self.config.build_dir / _cfg.BUILD_EXAMPLES_SUBDIR
+        ) / f"{example_name}.pdf"
 
         # Fast path: check mtimes first (stat-only, no file reads)
         cached_mtimes = cached.get("mtimes")
         if cached_mtimes:
             current_mtimes = self._get_mtimes(source_files)
             if current_mtimes == cached_mtimes:
-                dest_pdf = (
-                    _cfg.REPO_ROOT / self.config.build_dir / _cfg.BUILD_EXAMPLES_SUBDIR
-                ) / f"{example_name}.pdf"
-                return dest_pdf.exists()
+                return dest_pdf.exists(), None
 
         # Slow path: full hash comparison
         source_hash = self._hash_for_paths(source_files)
-        dest_pdf = (
-            _cfg.REPO_ROOT / self.config.build_dir / _cfg.BUILD_EXAMPLES_SUBDIR
-        ) / f"{example_name}.pdf"
-        return cached.get("source_hash") == source_hash and dest_pdf.exists()
+        hit = cached.get("source_hash") == source_hash and dest_pdf.exists()
+        return hit, source_hash
+
+    def _artifact_dir(self) -> Path:
+        return _cfg.REPO_ROOT / self.config.build_dir / "cache"
+
+    def _artifact_path(self, source_hash: str) -> Path:
+        """Artifact location for *source_hash* built in the current mode."""
+        parts = [source_hash, self.runner.build_mode, *(self.config.cnf_lines or ())]
+        key = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+        return self._artifact_dir() / f"{key}.pdf"
+
+    def _restore_artifact(
+        self, source_hash: str, dest_pdf: Path, dest_log: Path | None = None
+    ) -> int:
+        """Copy the cached PDF (and its log) for *source_hash* into place.
+
+        Returns the restored size, or 0 when no artifact exists.
+        """
+        artifact = self._artifact_path(source_hash)
+        try:
+            dest_pdf.parent.mkdir(parents=True, exist_ok=True)
+            _cfg.copy_file(artifact, dest_pdf)
+            os.utime(artifact)  # keep recently restored artifacts from pruning
+            size = dest_pdf.stat().st_size
+        except OSError:
+            return 0
+        if dest_log is not None:
+            try:
+                shutil.copyfile(artifact.with_suffix(".log"), dest_log)
+            except OSError:
+                pass
+        return size
+
+    def _store_artifact(
+        self, source_hash: str, pdf: Path, log: Path | None = None
+    ) -> None:
+        """Store *pdf* (and its *log*) under *source_hash*."""
+        artifact = self._artifact_path(source_hash)
+        sources = [(pdf, artifact)]
+        if log is not None and log.exists():
+            sources.append((log, artifact.with_suffix(".log")))
+        try:
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            # The log goes first so a stored PDF always has its log beside it.
+            for src, dest in reversed(sources):
+                fd, tmp_path = tempfile.mkstemp(dir=artifact.parent, suffix=".tmp")
+                os.close(fd)
+                try:
+                    _cfg.copy_file(src, Path(tmp_path))
+                    os.replace(tmp_path, dest)
+                except OSError:
+                    os.unlink(tmp_path)
+                    raise
+        except OSError:
+            logger.debug("Failed to store build artifact", exc_info=True)
+
+    def _prune_artifacts(self, max_entries: int) -> None:
+        """Delete the least recently used artifacts beyond *max_entries*."""
+        artifacts = []
+        try:
+            with os.scandir(self._artifact_dir()) as it:
+                for entry in it:
+                    if entry.name.endswith(".pdf"):
+                        artifacts.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            return
+        if len(artifacts) <= max_entries:
+            return
+        artifacts.sort()
+        for _, path in artifacts[: len(artifacts) - max_entries]:
+            for stale in (path, path[: -len(".pdf")] + ".log"):
+                try:
+                    os.unlink(stale)
+                except FileNotFoundError:
+                    pass
 
     def _load_build_cache(self) -> dict:
         """Load the build cache from disk. Returns empty dict on missing/corrupt file."""
@@ -121,8 +236,6 @@ class BuildCacheMixin:
         Uses atomic write (write to temp file, then rename) to prevent
         corruption if the process is killed mid-write.
         """
-        import tempfile
-
         cache = self._evict_cache(cache)
         cache_path = self.config.build_dir / "build_cache.json"
         cache_path.parent.mkdir(parents=True, exist_ok=True)
@@ -175,3 +288,7 @@ class BuildCacheMixin:
             self.ui.success(f"Deleted build cache: {cache_path}")
         else:
             self.ui.info("No build cache file to delete.")
+        artifact_dir = self._artifact_dir()
+        if artifact_dir.is_dir():
+            shutil.rmtree(artifact_dir, ignore_errors=True)
+            self.ui.success(f"Deleted build artifacts: {artifact_dir}")
@@ -5,15 +5,66 @@ Provides methods for cleaning auxiliary files, PDFs, and build artifacts.
 
 from __future__ import annotations
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import buildlib.config as _cfg
 
+# What ``latexmk -c`` removes from an example: the usual auxiliary
+# extensions plus the .latexmkrc generated_exts and clean_ext entries.
+_AUX_SUFFIXES = (
+    ".aux",
+    ".log",
+    ".fls",
+    ".fdb_latexmk",
+    ".toc",
+    ".out",
+    ".synctex.gz",
+    ".bbl",
+    ".blg",
+    ".bcf",
+    ".run.xml",
+    ".xdv",
+    ".lof",
+    ".lot",
+    ".loe",
+    ".lol",
+    ".lor",
+    ".glg",
+    ".glstex",
+    ".idx",
+    ".ind",
+    ".ilg",
+    ".nav",
+    ".snm",
+    ".vrb",
+)
+
+
+def _has_aux_files(example_dir: Path) -> bool:
+    """Return False only if *example_dir* holds nothing for ``latexmk -c``.
+
+    Unreadable or missing directories report True so latexmk still runs and
+    reports the problem itself.
+    """
+    try:
+        with os.scandir(example_dir) as it:
+            return any(
+                e.name.endswith(_AUX_SUFFIXES)
+                or e.name.startswith("_minted-")
+                or "_contourtmp" in e.name
+                for e in it
+            )
+    except OSError:
+        return True
+
 
 class CleanupMixin:
     """Mixin providing cleanup operations.
 
-    Requires self.config, self.runner, self.ui
+    Requires self.config, self.runner, self.ui, self.jobs
     to be set by the inheriting class.
     """
 
@@ -31,32 +82,55 @@ class CleanupMixin:
         self.clean_example([e.name for e in self.discover_examples()])
 
     def clean_example(self, files: list[str]):
-        """Clean auxiliary files from specific examples."""
+        """Clean auxiliary files from specific examples.
+
+        Each ``latexmk -c`` pays its own Perl start-up, and examples are
+        independent, so the invocations run concurrently (up to ``self.jobs``).
+        """
         if files:
             self.ui.info(f"Cleaning {len(files)} example(s)")
-            for name in files:
-                example_dir = _cfg.REPO_ROOT / "examples" / name
-                try:
-                    exit_code, _ = self.runner.run(
-                        [_cfg.LATEXMK_COMMAND, "-c"], cwd=example_dir
-                    )
-                    if exit_code != 0:
-                        self.ui.warning(f"Could not clean example {name}")
-                except OSError:
-                    self.ui.warning(f"Could not clean example {name}")
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                list(executor.map(self._clean_one_example, files))
+
+    def _clean_one_example(self, name: str) -> None:
+        """Run ``latexmk -c`` in a single example directory."""
+        example_dir = _cfg.REPO_ROOT / "examples" / name
+        if not _has_aux_files(example_dir):
+            return
+        try:
+            exit_code, _ = self.runner.run(
+                [_cfg.LATEXMK_COMMAND, "-c"], cwd=example_dir
+            )
+            if exit_code != 0:
+                self.ui.warning(f"Could not clean example {name}")
+        except OSError:
+            self.ui.warning(f"Could not clean example {name}")
 
     def clean_pdf(self, _: object | None = None) -> None:
         """Remove all generated PDFs from build and examples directories."""
         self.ui.header("Cleaning PDF files")
         count = 0
-        build_examples = self.config.build_dir / "examples"
-        if build_examples.is_dir():
-            for pdf in build_examples.glob("*.pdf"):
-                pdf.unlink(missing_ok=True)
-                count += 1
-        examples_dir = _cfg.REPO_ROOT / "examples"
-        if examples_dir.is_dir():
-            for pdf in examples_dir.rglob("*.pdf"):
-                pdf.unlink(missing_ok=True)
-                count += 1
+        # Flat directory: stream dirents and unlink in place, no Path objects.
+        try:
+            with os.scandir(self.config.build_dir / "examples") as it:
+                for entry in it:
+                    if entry.name.endswith(".pdf") and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+                        count += 1
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        # Nested tree: os.walk hands back bare names, so only PDFs become paths.
+        for dirpath, _dirnames, filenames in os.walk(_cfg.REPO_ROOT / "examples"):
+            for name in filenames:
+                if name.endswith(".pdf"):
+                    try:
+                        os.unlink(os.path.join(dirpath, name))
+                    except FileNotFoundError:
+                        pass
+                    count += 1
         self.ui.success(f"Removed {count} PDF(s).")
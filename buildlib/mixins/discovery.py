@@ -7,9 +7,99 @@ and listing available examples.
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import buildlib.config as _cfg
+from buildlib.mixins.cleanup import _AUX_SUFFIXES
+
+_SOURCE_EXCLUDE_DIRS = frozenset(
+    {".git", "node_modules", "build", ".venv", ".direnv", "__pycache__", ".nix"}
+)
+_SOURCE_SUFFIXES = (".sty", ".cls")
+_LUA_SUFFIXES = (".lua",)
+_REPO_WIDE_SUFFIXES = _SOURCE_SUFFIXES + _LUA_SUFFIXES
+# Repo-level inputs outside the .sty/.cls/.lua walk.
+_SHARED_INPUT_DIRS = ("assets",)
+_SHARED_INPUT_FILES = (".latexmkrc",)
+# Files latexmk writes into an example directory; everything else there is
+# treated as an input (\inputminted listings, PDF figures, data files, ...).
+_BUILD_OUTPUT_SUFFIXES = _AUX_SUFFIXES + (
+    ".dvi",
+    ".glo",
+    ".gls",
+    ".acn",
+    ".acr",
+    ".alg",
+    ".ist",
+    ".xdy",
+    ".glsdefs",
+)
+_BUILD_OUTPUT_DIRS = _SOURCE_EXCLUDE_DIRS | {
+    _cfg.MINTED_CACHE_SUBDIR,
+    _cfg.SVG_INKSCAPE_CACHE,
+}
+
+
+def _walk_source_files(
+    root: Path, suffixes: tuple[str, ...] = _SOURCE_SUFFIXES
+) -> list[Path]:
+    """Collect files ending in *suffixes* under *root* in one os.scandir pass.
+
+    Excluded directories are never opened, and symlinked directories are not
+    followed (matching rglob).
+    """
+    found: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SOURCE_EXCLUDE_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    found.append(Path(entry.path))
+    return found
+
+
+def _is_build_output(name: str) -> bool:
+    return (
+        name == "main.pdf"
+        or name.endswith(_BUILD_OUTPUT_SUFFIXES)
+        or "_contourtmp" in name
+    )
+
+
+def _walk_example_inputs(example_dir: Path) -> list[Path]:
+    """Collect every regular file under *example_dir* except build outputs.
+
+    .sty/.cls/.lua files are left to the repo-wide walk, which already
+    includes them.
+    """
+    found: list[Path] = []
+    stack = [str(example_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _BUILD_OUTPUT_DIRS and not name.startswith(
+                        "_minted"
+                    ):
+                        stack.append(entry.path)
+                elif name.endswith(_REPO_WIDE_SUFFIXES) or _is_build_output(name):
+                    continue
+                elif entry.is_file():
+                    found.append(Path(entry.path))
+    return found
 
 
 class DiscoveryMixin:
@@ -23,55 +113,46 @@ class DiscoveryMixin:
         """Find all .sty and .cls files, excluding non-source directories."""
         key = str(repo_root)
         if key not in self._source_files_cache:
-            exclude = {
-                ".git",
-                "node_modules",
-                "build",
-                ".venv",
-                ".direnv",
-                "__pycache__",
-                ".nix",
-            }
-            sty_files = [
-                p
-                for p in repo_root.rglob("*.sty")
-                if not any(d in exclude for d in p.parts)
-            ]
-            cls_files = [
-                p
-                for p in repo_root.rglob("*.cls")
-                if not any(d in exclude for d in p.parts)
-            ]
-            self._source_files_cache[key] = sty_files + cls_files
+            self._source_files_cache[key] = sorted(_walk_source_files(repo_root))
+        return self._source_files_cache[key]
+
+    def _get_shared_inputs(self, repo_root: Path) -> list[Path]:
+        """Find repo-level inputs every example may load.
+
+        The Lua modules (loaded via \\directlua/require), the asset tree
+        (logos referenced by config/institutions/*.sty, fonts, images) and
+        the root .latexmkrc passed to every example build.
+        """
+        key = f"{repo_root}:shared"
+        if key not in self._source_files_cache:
+            files = _walk_source_files(repo_root, _LUA_SUFFIXES)
+            for name in _SHARED_INPUT_DIRS:
+                files.extend(_walk_example_inputs(repo_root / name))
+            files.extend(
+                path
+                for path in (repo_root / name for name in _SHARED_INPUT_FILES)
+                if path.is_file()
+            )
+            self._source_files_cache[key] = sorted(files)
         return self._source_files_cache[key]
 
     def _collect_source_files(self, example_name: str) -> list[Path]:
-        """Collect all source files relevant to an example (tex, bib, sty, cls)."""
+        """Collect all source files relevant to an example.
+
+        Every file under the example directory except latexmk outputs (so
+        listings, PDF figures and data files count), plus the repo-wide
+        .sty/.cls set and the shared inputs from :meth:`_get_shared_inputs`.
+        """
         repo_root = _cfg.REPO_ROOT
         example_dir = repo_root / "examples" / example_name
-        files: list[Path] = []
-        tex_file = example_dir / _cfg.MAIN_TEX_FILENAME
-        if tex_file.exists():
-            files.append(tex_file)
-        for bib in example_dir.rglob("*.bib"):
-            files.append(bib)
+        files = _walk_example_inputs(example_dir)
         files.extend(self._get_source_files(repo_root))
+        files.extend(self._get_shared_inputs(repo_root))
         return files
 
     def discover_examples(self) -> list[Path]:
         """Find all example directories containing a main.tex file."""
-        d = _cfg.REPO_ROOT / "examples"
-        return (
-            sorted(
-                [
-                    p
-                    for p in d.iterdir()
-                    if p.is_dir() and (p / _cfg.MAIN_TEX_FILENAME).is_file()
-                ]
-            )
-            if d.is_dir()
-            else []
-        )
+        return _cfg.find_example_dirs(_cfg.REPO_ROOT / "examples")
 
     def list_examples(
         self,
@@ -16,11 +16,11 @@ from statistics import mean, median, stdev
 from typing import Any
 
 from buildlib.config import (
-    MAIN_TEX_FILENAME,
     REPO_ROOT,
     ProjectConfig,
     base_build_env,
     build_latexmk_command,
+    find_example_dirs,
 )
 
 # ---------------------------------------------------------------------------
@@ -113,14 +113,7 @@ class BuildProfiler:
 
     def discover_examples(self) -> list[Path]:
         """Find all example directories containing main.tex."""
-        examples_dir = REPO_ROOT / "examples"
-        if not examples_dir.is_dir():
-            return []
-        return sorted(
-            p
-            for p in examples_dir.iterdir()
-            if p.is_dir() and (p / MAIN_TEX_FILENAME).is_file()
-        )
+        return find_example_dirs(REPO_ROOT / "examples")
 
     def profile_example(
         self,
@@ -5,8 +5,9 @@ from __future__ import annotations
 import os
 import subprocess
 import threading
+from collections import deque
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
 
 from buildlib.ui import TerminalOutput
 
@@ -16,8 +17,15 @@ class CommandRunner:
 
     DEFAULT_TIMEOUT = 3600  # 1 hour
 
+    # Only the tail of a command's output is kept in memory: latexmk can emit
+    # tens of thousands of lines, and the full record is in the .log file.
+    LOG_TAIL_LINES = 5000
+
     def __init__(self, ui: TerminalOutput, build_mode: str, verbose: bool):
         self.ui, self.build_mode, self.verbose = ui, build_mode, verbose
+        # Snapshot the environment once; run() only layers extra_env on top.
+        # Treated as read-only so the runner can be shared across threads.
+        self._base_env = {**os.environ, "BUILD_MODE": build_mode}
 
     def run(
         self,
@@ -38,17 +46,16 @@ class CommandRunner:
 
         if self.verbose:
             self.ui.debug(f"RUN in '{cwd or Path.cwd()}': " f"{' '.join(cmd_args)}")
-        env = os.environ.copy()
-        env["BUILD_MODE"] = self.build_mode
-        if extra_env:
-            env.update(extra_env)
+        env = {**self._base_env, **extra_env} if extra_env else self._base_env
 
-        logs: list[str] = []
+        logs: deque[str] = deque(maxlen=self.LOG_TAIL_LINES)
+        line_count = 0
         lock = threading.Lock()
         timeout_event = threading.Event()
 
         def _reader(stream):
             """Read lines from *stream* until EOF or timeout."""
+            nonlocal line_count
             try:
                 for line in iter(stream.readline, ""):
                     if timeout_event.is_set():
@@ -56,6 +63,7 @@ class CommandRunner:
                     stripped = line.rstrip()
                     with lock:
                         logs.append(stripped)
+                        line_count += 1
                     if on_line:
                         on_line(stripped)
             finally:
@@ -102,7 +110,12 @@ class CommandRunner:
 
             if reader is not None:
                 reader.join(timeout=5)
-            return return_code, logs
+            with lock:
+                tail = list(logs)
+                omitted = line_count - len(tail)
+            if omitted:
+                tail.insert(0, f"[... {omitted} earlier line(s) omitted ...]")
+            return return_code, tail
 
         except FileNotFoundError as e:
             return -1, [f"Command not found: {cmd_args[0]}", str(e)]
@@ -110,3 +123,51 @@ class CommandRunner:
             return -1, [f"Permission denied: {cmd_args[0]}", str(e)]
         except OSError as e:
             return -1, [f"OS error running {cmd_args[0]}: {e}"]
+
+    def run_grep(
+        self,
+        cmd_args: list[str],
+        needles: Iterable[bytes],
+        *,
+        ignore_case: bool = False,
+        timeout: int = 30,
+    ) -> set[bytes]:
+        """Stream a command's stdout and return which *needles* occur in it.
+
+        Output is scanned line by line as bytes and the process is terminated
+        as soon as every needle has been seen, so large listings are neither
+        buffered in full nor decoded. With *ignore_case*, needles must be
+        given in lower case. Returns an empty set if the command cannot run.
+        """
+        pending = set(needles)
+        found: set[bytes] = set()
+        try:
+            process = subprocess.Popen(
+                cmd_args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=-1,
+                env=self._base_env,
+            )
+        except OSError:
+            return found
+
+        watchdog = threading.Timer(timeout, process.kill)
+        watchdog.start()
+        try:
+            assert process.stdout is not None
+            for line in process.stdout:
+                if ignore_case:
+                    line = line.lower()
+                hits = {n for n in pending if n in line}
+                if hits:
+                    found |= hits
+                    pending -= hits
+                    if not pending:
+                        process.terminate()
+                        break
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+            process.wait()
+        return found
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+import threading
 
 
 class TerminalOutput:
@@ -14,50 +15,99 @@ class TerminalOutput:
             Falls back to ASCII ([OK], [WARN], [ERR]) when False.
     """
 
+    # Shared by all instances: example workers log from pool threads.
+    _lock = threading.Lock()
+
+    _PALETTE = {
+        "blue": "\033[94m",
+        "green": "\033[92m",
+        "yellow": "\033[93m",
+        "red": "\033[91m",
+        "cyan": "\033[96m",
+        "gray": "\033[90m",
+        "bold": "\033[1m",
+        "end": "\033[0m",
+    }
+    _NO_PALETTE = dict.fromkeys(_PALETTE, "")
+
+    # (check, warn, cross) status symbols
+    _UNICODE_SYMBOLS = ("\u2713", "\u26a0", "\u2717")
+    _ASCII_SYMBOLS = ("[OK]", "[WARN]", "[ERR]")
+
     def __init__(
         self,
         use_color: bool = sys.stdout.isatty(),
         use_unicode: bool = True,
     ):
-        p = {
-            "blue": "\033[94m",
-            "green": "\033[92m",
-            "yellow": "\033[93m",
-            "red": "\033[91m",
-            "cyan": "\033[96m",
-            "gray": "\033[90m",
-            "bold": "\033[1m",
-            "end": "\033[0m",
-        }
-        if use_color:
-            self.__dict__.update(p)
-        else:
-            self.__dict__.update({k: "" for k in p})
-
-        # Unicode symbols with ASCII fallback
-        if use_unicode:
-            self._check = "\u2713"
-            self._warn = "\u26a0"
-            self._cross = "\u2717"
-        else:
-            self._check = "[OK]"
-            self._warn = "[WARN]"
-            self._cross = "[ERR]"
+        self.__dict__.update(self._PALETTE if use_color else self._NO_PALETTE)
+        self._check, self._warn, self._cross = (
+            self._UNICODE_SYMBOLS if use_unicode else self._ASCII_SYMBOLS
+        )
+        # Per-level prefixes are fixed once palette and symbols are chosen.
+        self._p_info = f"{self.cyan}[INFO]{self.end} "
+        self._p_success = f"{self.green}[{self._check}] "
+        self._p_warning = f"{self.yellow}[{self._warn}] "
+        self._p_error = f"{self.bold}{self.red}[{self._cross}] "
+        self._p_debug = f"{self.gray}[DEBUG] "
+
+    def _write(self, text: str, stream=None) -> None:
+        """Emit *text* plus newline as a single write on the buffered stream.
+
+        Unlike print(), which issues separate writes for the message and the
+        line terminator, this hands the stream one string per message and
+        leaves flushing to the stream's own buffering (see flush()).
+        """
+        with self._lock:
+            (stream or sys.stdout).write(text + "\n")
+
+    def flush(self) -> None:
+        """Flush buffered output; called once at the end of each CLI command."""
+        with self._lock:
+            sys.stdout.flush()
+            sys.stderr.flush()
 
     def header(self, m: str):
-        print(f"\n{self.bold}{self.blue}=== {m} ==={self.end}")
+        self._write(f"\n{self.bold}{self.blue}=== {m} ==={self.end}")
 
     def info(self, m: str):
-        print(f"{self.cyan}[INFO]{self.end} {m}")
+        self._write(f"{self._p_info}{m}")
 
     def success(self, m: str):
-        print(f"{self.green}[{self._check}] {m}{self.end}")
+        self._write(f"{self._p_success}{m}{self.end}")
 
     def warning(self, m: str):
-        print(f"{self.yellow}[{self._warn}] {m}{self.end}")
+        self._write(f"{self._p_warning}{m}{self.end}")
 
     def error(self, m: str):
-        print(f"{self.bold}{self.red}[{self._cross}] {m}{self.end}", file=sys.stderr)
+        self._write(f"{self._p_error}{m}{self.end}", sys.stderr)
 
     def debug(self, m: str):
-        print(f"{self.gray}[DEBUG] {m}{self.end}")
+        self._write(f"{self._p_debug}{m}{self.end}")
+
+    def plain(self, m: str):
+        """Write *m* as-is, e.g. raw log lines."""
+        self._write(m)
+
+
+class BufferedOutput(TerminalOutput):
+    """Holds messages for *target* until :meth:`replay`.
+
+    Lets a background task report through the usual methods without its
+    output cutting into another task's progress display.
+    """
+
+    def __init__(self, target: TerminalOutput):
+        self.__dict__.update(target.__dict__)  # same palette and symbols
+        self._target = target
+        self._pending: list[tuple[str, object]] = []
+
+    def _write(self, text: str, stream=None) -> None:
+        with self._lock:
+            self._pending.append((text, stream))
+
+    def replay(self) -> None:
+        """Write the held messages to the target, in order, then forget them."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for text, stream in pending:
+            self._target._write(text, stream)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import threading
 import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -197,6 +198,60 @@ class TestBuildCore:
         sty_files = [f for f in files if f.suffix == ".sty"]
         assert len(sty_files) > 0
 
+    def test_collect_source_files_includes_nested_inputs(
+        self, build_core, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        ex = tmp_path / "examples" / "demo"
+        (ex / "chapters").mkdir(parents=True)
+        (ex / "main.tex").write_text("", encoding="utf-8")
+        (ex / "chapters" / "intro.tex").write_text("", encoding="utf-8")
+        (ex / "main.pdf").write_bytes(b"%PDF")
+        files = build_core._collect_source_files("demo")
+        assert sorted(f.relative_to(ex).as_posix() for f in files) == [
+            "chapters/intro.tex",
+            "main.tex",
+        ]
+
+    def test_collect_source_files_includes_non_tex_inputs(
+        self, build_core, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        ex = tmp_path / "examples" / "demo"
+        for rel in (
+            "main.tex",
+            "config/queries.sql",
+            "config/analysis.py",
+            "figures/plot.pdf",
+            "figures/diagram.eps",
+            # build outputs
+            "main.pdf",
+            "main.aux",
+            "main.log",
+            "main.fls",
+            "_minted/abc.pygtex",
+            "svg-inkscape/logo_svg-tex.pdf",
+            "build/main.pdf",
+        ):
+            (ex / rel).parent.mkdir(parents=True, exist_ok=True)
+            (ex / rel).write_bytes(b"")
+        (tmp_path / "lua").mkdir()
+        (tmp_path / "lua" / "helpers.lua").write_text("", encoding="utf-8")
+        (tmp_path / "assets" / "logos").mkdir(parents=True)
+        (tmp_path / "assets" / "logos" / "tuhh.svg").write_text("", encoding="utf-8")
+        (tmp_path / ".latexmkrc").write_text("", encoding="utf-8")
+        files = build_core._collect_source_files("demo")
+        assert sorted(f.relative_to(tmp_path).as_posix() for f in files) == [
+            ".latexmkrc",
+            "assets/logos/tuhh.svg",
+            "examples/demo/config/analysis.py",
+            "examples/demo/config/queries.sql",
+            "examples/demo/figures/diagram.eps",
+            "examples/demo/figures/plot.pdf",
+            "examples/demo/main.tex",
+            "lua/helpers.lua",
+        ]
+
     def test_thread_locks_initialized(self, build_core):
         assert isinstance(build_core._timings_lock, type(threading.Lock()))
         assert isinstance(build_core._cache_lock, type(threading.Lock()))
@@ -380,6 +435,18 @@ class TestBuildExamplesSimpleConcurrent:
         ):
             build_core._build_examples_simple_concurrent(["ex1"])
 
+    def test_simple_concurrent_no_progress_bar_off_tty(
+        self, build_core, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        monkeypatch.setattr("sys.stdout.isatty", lambda: False)
+
+        with patch.object(
+            build_core, "_compile_example_worker", return_value=("ex1", True, [])
+        ), patch("buildlib.builder._get_tqdm") as get_tqdm:
+            build_core._build_examples_simple_concurrent(["ex1"])
+        get_tqdm.assert_not_called()
+
 
 class TestBuildExamplesWithTimings:
     """Test build_examples with timings output."""
@@ -447,6 +514,132 @@ class TestBuildRootSuccess:
         dest = tmp_path / "build" / "main.pdf"
         assert dest.exists()
 
+    def test_build_root_runs_at_repo_root(self, build_core, tmp_path, monkeypatch):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", False)
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        build_core.config.build_dir = Path("build")
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path / "sub")
+        (tmp_path / "main.pdf").write_bytes(b"%PDF-1.4 fake")
+
+        with patch.object(build_core.runner, "run", return_value=(0, [])) as run:
+            build_core.build_root()
+
+        assert run.call_args.kwargs["cwd"] == tmp_path
+        assert (tmp_path / "build" / "main.pdf").exists()
+        assert not (tmp_path / "sub" / "build").exists()
+
+    def _fake_root_build(self, tmp_path):
+        (tmp_path / "main.pdf").write_bytes(b"%PDF-1.4 fake")
+        (tmp_path / "main.fls").write_text(
+            f"PWD {tmp_path}\n"
+            "INPUT /usr/share/texmf/tex/latex/base/article.cls\n"
+            "INPUT ./main.tex\n"
+            "INPUT ./content/chapter.tex\n"
+            "INPUT ./main.aux\n"
+            "OUTPUT ./main.aux\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "main.bcf").write_text(
+            '<bcf:datasource type="file" datatype="bibtex" glob="false">'
+            "bib/bibliography.bib</bcf:datasource>\n"
+            '<bcf:datasource type="file" datatype="bibtex">'
+            "/usr/share/missing.bib</bcf:datasource>\n",
+            encoding="utf-8",
+        )
+        return 0, []
+
+    def test_build_root_skips_latexmk_when_inputs_unchanged(
+        self, build_core, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", False)
+        build_core.config.build_dir = tmp_path / "build"
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        (tmp_path / "main.tex").write_text("root", encoding="utf-8")
+        (tmp_path / "content").mkdir()
+        chapter = tmp_path / "content" / "chapter.tex"
+        chapter.write_text("one", encoding="utf-8")
+
+        def fake_run(*args, **kwargs):
+            return self._fake_root_build(tmp_path)
+
+        with patch.object(build_core.runner, "run", side_effect=fake_run) as run:
+            build_core.build_root()
+            build_core.build_root()
+            assert run.call_count == 1
+
+            chapter.write_text("two", encoding="utf-8")
+            build_core.build_root()
+            assert run.call_count == 2
+
+            build_core.force = True
+            build_core.build_root()
+            assert run.call_count == 3
+
+    @pytest.mark.parametrize("edited", ["bib/bibliography.bib", ".latexmkrc"])
+    def test_build_root_reruns_when_non_tex_input_changes(
+        self, build_core, tmp_path, monkeypatch, edited
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", False)
+        build_core.config.build_dir = tmp_path / "build"
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        (tmp_path / "main.tex").write_text("root", encoding="utf-8")
+        (tmp_path / "content").mkdir()
+        (tmp_path / "content" / "chapter.tex").write_text("one", encoding="utf-8")
+        (tmp_path / "bib").mkdir()
+        (tmp_path / "bib" / "bibliography.bib").write_text("@a{x,}", encoding="utf-8")
+        (tmp_path / ".latexmkrc").write_text("$pdf_mode = 4;", encoding="utf-8")
+
+        def fake_run(*args, **kwargs):
+            return self._fake_root_build(tmp_path)
+
+        with patch.object(build_core.runner, "run", side_effect=fake_run) as run:
+            build_core.build_root()
+            build_core.build_root()
+            assert run.call_count == 1
+
+            (tmp_path / edited).write_text("changed", encoding="utf-8")
+            build_core.build_root()
+            assert run.call_count == 2
+
+    def test_read_bcf_datasources_keeps_project_files(self, tmp_path):
+        from buildlib.builder import read_bcf_datasources
+
+        (tmp_path / "bib").mkdir()
+        (tmp_path / "bib" / "bibliography.bib").write_text("", encoding="utf-8")
+        self._fake_root_build(tmp_path)
+        sources = read_bcf_datasources(tmp_path / "main.bcf", tmp_path)
+        assert sources == [tmp_path / "bib" / "bibliography.bib"]
+
+    def test_build_root_dashboard_records_build(
+        self, build_core, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", True)
+        monkeypatch.setattr(build_core.config, "is_ci", lambda: False)
+        build_core.config.build_dir = tmp_path / "build"
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        (tmp_path / "main.tex").write_text("root", encoding="utf-8")
+        (tmp_path / "content").mkdir()
+        (tmp_path / "content" / "chapter.tex").write_text("one", encoding="utf-8")
+
+        def fake_dashboard(*args, **kwargs):
+            return self._fake_root_build(tmp_path)
+
+        with patch.object(
+            build_core, "_run_with_dashboard", side_effect=fake_dashboard
+        ) as dashboard, patch.object(build_core.runner, "run") as run:
+            build_core.build_root()
+            build_core.build_root()
+        assert dashboard.call_count == 1
+        run.assert_not_called()
+
+    def test_read_fls_inputs_keeps_project_inputs(self, tmp_path):
+        from buildlib.builder import read_fls_inputs
+
+        self._fake_root_build(tmp_path)
+        inputs = read_fls_inputs(tmp_path / "main.fls", tmp_path)
+        assert inputs == [tmp_path / "main.tex", tmp_path / "content" / "chapter.tex"]
+
 
 class TestBuildExamplesRichConcurrent:
     """Test _build_examples_rich_concurrent with mocked Rich."""
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -55,6 +59,14 @@ class TestTqdmFallback:
         finally:
             monkeypatch.setattr("buildlib.builder.tqdm", real_tqdm)
 
+    def test_get_tqdm_falls_back_when_missing(self, monkeypatch):
+        import buildlib.builder as mod
+
+        monkeypatch.setattr(mod, "tqdm", None)
+        monkeypatch.setitem(sys.modules, "tqdm", None)
+        assert mod._get_tqdm() is mod.TqdmFallback
+        assert mod.tqdm is mod.TqdmFallback
+
 
 class TestCompileWorkerCopyException:
     def test_compile_worker_copy_exception(self, build_core, tmp_path, monkeypatch):
@@ -68,12 +80,70 @@ class TestCompileWorkerCopyException:
         pdf.write_bytes(b"%PDF-1.4 fake")
 
         with patch.object(build_core.runner, "run", return_value=(0, [])), patch(
-            "buildlib.builder.shutil.copy", side_effect=OSError("copy fail")
+            "buildlib.builder.copy_file", side_effect=OSError("copy fail")
         ):
             name, success, logs = build_core._compile_example_worker("test")
             assert not success
 
 
+class TestSetupBuildEnv:
+    def test_env_paths_derive_from_resolved_example_root(self, build_core, tmp_path):
+        ex = tmp_path / "examples" / "demo"
+        ex.mkdir(parents=True)
+        invoke, env = build_core._setup_build_env(ex, tmp_path)
+        root = ex.resolve()
+        assert env["OMNILATEX_EXAMPLE_ROOT"] == str(root)
+        assert env["MINTED_CACHE_DIR"] == str(root / "_minted")
+        assert (ex / "_minted").is_dir()
+        assert (ex / "svg-inkscape").is_dir()
+        assert invoke[-1] == "main.tex"
+
+    def test_each_cache_dir_created_once(self, build_core, tmp_path, monkeypatch):
+        ex = tmp_path / "demo"
+        ex.mkdir()
+        made: list[Path] = []
+        real_mkdir = Path.mkdir
+
+        def spy(self, *args, **kwargs):
+            made.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", spy)
+        build_core._setup_build_env(ex, tmp_path)
+        assert sorted(p.name for p in made) == ["_minted", "svg-inkscape"]
+
+
+class TestCopyBuildOutput:
+    def test_copies_pdf_and_log(self, build_core, tmp_path):
+        ex = tmp_path / "ex"
+        ex.mkdir()
+        (ex / "main.pdf").write_bytes(b"%PDF-1.4 fake")
+        (ex / "main.log").write_text("log", encoding="utf-8")
+        out = tmp_path / "out"
+        out.mkdir()
+        success, logs, size = build_core._copy_build_output("demo", ex, out)
+        assert success is True
+        assert size == len(b"%PDF-1.4 fake")
+        assert (out / "demo.pdf").exists()
+        assert (out / "demo.log").exists()
+
+    def test_missing_log_is_not_an_error(self, build_core, tmp_path):
+        ex = tmp_path / "ex"
+        ex.mkdir()
+        (ex / "main.pdf").write_bytes(b"%PDF-1.4 fake")
+        out = tmp_path / "out"
+        out.mkdir()
+        success, logs, size = build_core._copy_build_output("demo", ex, out)
+        assert success is True
+        assert not (out / "demo.log").exists()
+
+    def test_missing_pdf(self, build_core, tmp_path):
+        success, logs, size = build_core._copy_build_output("demo", tmp_path, tmp_path)
+        assert success is False
+        assert size == 0
+        assert any("PDF not found" in line for line in logs)
+
+
 class TestCompileWorkerSharedCache:
     def test_compile_worker_shared_cache_path(self, build_core, tmp_path, monkeypatch):
         monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
@@ -96,6 +166,107 @@ class TestCompileWorkerSharedCache:
         assert "source_hash" in shared_cache["examples/test"]
 
 
+class TestArtifactCache:
+    @pytest.fixture
+    def built(self, build_core, tmp_path, monkeypatch):
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        ex = tmp_path / "examples" / "test"
+        ex.mkdir(parents=True)
+        (ex / "main.tex").write_text("v1", encoding="utf-8")
+        (ex / "main.pdf").write_bytes(b"%PDF-1.4 v1")
+        with patch.object(build_core.runner, "run", return_value=(0, [])):
+            assert build_core._compile_example_worker("test")[1] is True
+        (ex / "main.pdf").unlink()
+        return ex
+
+    def test_reverted_sources_restore_without_build(self, build_core, built):
+        (built / "main.tex").write_text("v2", encoding="utf-8")
+        dest = build_core.config.build_dir / "examples" / "test.pdf"
+        dest.unlink()
+        (built / "main.tex").write_text("v1", encoding="utf-8")
+        with patch.object(build_core.runner, "run") as run:
+            name, success, logs = build_core._compile_example_worker("test")
+        run.assert_not_called()
+        assert success is True
+        assert any("artifact cache" in line for line in logs)
+        assert dest.read_bytes() == b"%PDF-1.4 v1"
+
+    def test_other_build_mode_misses(self, build_core, built):
+        (build_core.config.build_dir / "examples" / "test.pdf").unlink()
+        build_core.runner.build_mode = "prod"
+        with patch.object(build_core.runner, "run", return_value=(0, [])) as run:
+            build_core._compile_example_worker("test")
+        run.assert_called()
+
+    def test_cache_clear_removes_artifacts(self, build_core, built):
+        artifact_dir = build_core.config.build_dir / "cache"
+        assert len(list(artifact_dir.glob("*.pdf"))) == 1
+        build_core.cmd_cache_clear()
+        assert not artifact_dir.exists()
+
+    def test_restore_brings_back_log(self, build_core, built):
+        dest = build_core.config.build_dir / "examples"
+        (built / "main.log").write_text("fresh log", encoding="utf-8")
+        with patch.object(build_core.runner, "run", return_value=(0, [])):
+            build_core.force = True
+            (built / "main.pdf").write_bytes(b"%PDF-1.4 v1")
+            build_core._compile_example_worker("test")
+            build_core.force = False
+        (dest / "test.pdf").unlink()
+        (dest / "test.log").unlink()
+        with patch.object(build_core.runner, "run") as run:
+            assert build_core._compile_example_worker("test")[1] is True
+        run.assert_not_called()
+        assert (dest / "test.log").read_text(encoding="utf-8") == "fresh log"
+
+    def test_miss_hashes_sources_once(self, build_core, built):
+        (build_core.config.build_dir / "examples" / "test.pdf").unlink()
+        (built / "main.tex").write_text("v2", encoding="utf-8")
+        (built / "main.pdf").write_bytes(b"%PDF-1.4 v2")
+        with patch.object(build_core.runner, "run", return_value=(0, [])), patch.object(
+            build_core, "_hash_for_paths", wraps=build_core._hash_for_paths
+        ) as hash_for_paths:
+            assert build_core._compile_example_worker("test")[1] is True
+        assert hash_for_paths.call_count == 1
+
+    def test_prune_keeps_newest(self, build_core, tmp_path):
+        pdf = tmp_path / "x.pdf"
+        log = tmp_path / "x.log"
+        pdf.write_bytes(b"%PDF")
+        log.write_text("log", encoding="utf-8")
+        for i, digest in enumerate(["a", "b", "c"]):
+            build_core._store_artifact(digest, pdf, log)
+            os.utime(build_core._artifact_path(digest), (i, i))
+        build_core._prune_artifacts(2)
+        remaining = set(build_core._artifact_dir().iterdir())
+        assert remaining == {
+            build_core._artifact_path(digest).with_suffix(suffix)
+            for digest in ("b", "c")
+            for suffix in (".pdf", ".log")
+        }
+
+    def test_store_does_not_prune(self, build_core, tmp_path):
+        build_core.ARTIFACT_CACHE_MAX = 1
+        pdf = tmp_path / "x.pdf"
+        pdf.write_bytes(b"%PDF")
+        for digest in ("a", "b", "c"):
+            build_core._store_artifact(digest, pdf)
+        assert len(list(build_core._artifact_dir().glob("*.pdf"))) == 3
+
+    def test_build_examples_prunes_to_example_count(self, build_core):
+        build_core.ARTIFACT_CACHE_MAX = 1
+        examples = [Path(f"/x/{i}") for i in range(5)]
+        with patch.object(
+            build_core, "discover_examples", return_value=examples
+        ), patch.object(build_core, "_build_examples_simple_concurrent"), patch(
+            "buildlib.builder.RICH_AVAILABLE", False
+        ), patch.object(
+            build_core, "_prune_artifacts"
+        ) as prune:
+            build_core.build_examples()
+        prune.assert_called_once_with(5 * build_core.ARTIFACTS_PER_EXAMPLE)
+
+
 class TestBuildRootFailure:
     def test_build_root_failure(self, build_core, tmp_path, monkeypatch):
         monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
@@ -361,3 +532,102 @@ class TestBuildAll:
             build_core.build_all()
             mock_root.assert_called_once()
             mock_ex.assert_called_once()
+
+    def test_build_all_overlaps_root_and_examples(self, build_core, monkeypatch):
+        from buildlib.ui import BufferedOutput
+
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", False)
+        build_core.jobs = 4
+        examples_started = threading.Event()
+        example_jobs = []
+
+        def fake_root(*args, **kwargs):
+            assert kwargs["dashboard"] is False
+            assert isinstance(kwargs["ui"], BufferedOutput)
+            assert examples_started.wait(timeout=5)
+
+        def fake_examples(*args, **kwargs):
+            example_jobs.append(build_core.jobs)
+            examples_started.set()
+
+        with patch.object(
+            build_core, "build_root", side_effect=fake_root
+        ), patch.object(build_core, "build_examples", side_effect=fake_examples):
+            build_core.build_all()
+        # The root build takes one of the job slots while it overlaps.
+        assert example_jobs == [3]
+        assert build_core.jobs == 4
+
+    @pytest.mark.parametrize("rich, jobs", [(True, 4), (False, 1)])
+    def test_build_all_builds_root_first_without_overlap(
+        self, build_core, monkeypatch, rich, jobs
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", rich)
+        build_core.jobs = jobs
+        calls = []
+        with patch.object(
+            build_core,
+            "build_root",
+            side_effect=lambda *a, **kw: calls.append(("root", kw)),
+        ), patch.object(
+            build_core,
+            "build_examples",
+            side_effect=lambda *a, **kw: calls.append(("examples", kw)),
+        ):
+            build_core.build_all()
+        assert calls == [("root", {}), ("examples", {})]
+
+    def test_build_all_root_failure_stops_before_examples(
+        self, build_core, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", True)
+        with patch.object(
+            build_core, "build_root", side_effect=SystemExit(1)
+        ), patch.object(build_core, "build_examples") as mock_ex:
+            with pytest.raises(SystemExit):
+                build_core.build_all()
+            mock_ex.assert_not_called()
+
+    def test_build_all_raises_root_failure_after_examples(
+        self, build_core, monkeypatch
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", False)
+        build_core.jobs = 2
+        with patch.object(
+            build_core, "build_root", side_effect=SystemExit(1)
+        ), patch.object(build_core, "build_examples") as mock_ex:
+            with pytest.raises(SystemExit):
+                build_core.build_all()
+            mock_ex.assert_called_once()
+
+    def test_build_all_prints_overlapped_root_output_after_examples(
+        self, build_core, tmp_path, monkeypatch, capsys
+    ):
+        monkeypatch.setattr("buildlib.builder.RICH_AVAILABLE", False)
+        monkeypatch.setattr("buildlib.builder.REPO_ROOT", tmp_path)
+        build_core.jobs = 2
+        root_done = threading.Event()
+        real_build_root = build_core.build_root
+
+        def build_root(*args, **kwargs):
+            try:
+                real_build_root(*args, **kwargs)
+            finally:
+                root_done.set()
+
+        def fake_examples(*args, **kwargs):
+            assert root_done.wait(timeout=5)
+            build_core.ui.info("examples finished")
+
+        with patch.object(
+            build_core, "build_root", side_effect=build_root
+        ), patch.object(
+            build_core, "build_examples", side_effect=fake_examples
+        ), patch.object(
+            build_core.runner, "run", return_value=(1, ["root log line"])
+        ):
+            with pytest.raises(SystemExit):
+                build_core.build_all()
+        out = capsys.readouterr().out
+        assert out.index("examples finished") < out.index("Building Root")
+        assert out.index("Building Root") < out.index("root log line")
@@ -180,6 +180,55 @@ class TestCmdCheck:
         result = check_lint.cmd_check(files=[str(tmp_tex_dir)])
         assert result == 0
 
+    def test_minted_cache_excluded(self, check_lint, tmp_tex_dir):
+        (tmp_tex_dir / "main.tex").write_text(r"\label{a} \ref{a}", encoding="utf-8")
+        minted = tmp_tex_dir / "_minted-main"
+        minted.mkdir()
+        (minted / "snippet.tex").write_text(r"\ref{missing}", encoding="utf-8")
+        assert list(check_lint._iter_tex_sources(tmp_tex_dir)) == [
+            tmp_tex_dir / "main.tex"
+        ]
+        assert check_lint.cmd_check(files=[str(tmp_tex_dir)]) == 0
+
+    def test_non_ascii_keys(self, check_lint, tmp_tex_dir, capsys):
+        (tmp_tex_dir / "main.tex").write_bytes(
+            "\\label{sec:übersicht} \\ref{sec:übersicht}\n".encode()
+            + "\\ref{fig:größe}\n".encode()
+            + b"\xff\xfe stray bytes\n"
+        )
+        assert check_lint.cmd_check(files=[str(tmp_tex_dir)]) == 1
+        out = capsys.readouterr().out
+        assert "\\ref{fig:größe}" in out
+        assert "übersicht}" not in out
+
+    def test_pruned_dirs_not_walked(self, check_lint, tmp_tex_dir):
+        check_lint.config = ProjectConfig(build_dir=tmp_tex_dir / "build")
+        for sub in ("build", ".git", "node_modules", "svg-inkscape", "chapters"):
+            (tmp_tex_dir / sub).mkdir()
+            (tmp_tex_dir / sub / "x.tex").write_text("", encoding="utf-8")
+        (tmp_tex_dir / "refs.bib").write_text("", encoding="utf-8")
+        assert list(check_lint._iter_tex_sources(tmp_tex_dir)) == [
+            tmp_tex_dir / "chapters" / "x.tex"
+        ]
+        assert list(check_lint._iter_tex_sources(tmp_tex_dir, ".bib")) == [
+            tmp_tex_dir / "refs.bib"
+        ]
+
+    def test_relative_build_dir_pruned(self, check_lint, tmp_tex_dir, monkeypatch):
+        """The default relative build_dir is pruned for absolute and relative roots."""
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_tex_dir)
+        monkeypatch.chdir(tmp_tex_dir)
+        assert check_lint.config.build_dir == Path("build")
+        for sub in ("build", "chapters"):
+            (tmp_tex_dir / sub).mkdir()
+            (tmp_tex_dir / sub / "x.tex").write_text("", encoding="utf-8")
+        assert list(check_lint._iter_tex_sources(tmp_tex_dir)) == [
+            tmp_tex_dir / "chapters" / "x.tex"
+        ]
+        assert list(check_lint._iter_tex_sources(Path("."))) == [
+            Path("chapters", "x.tex")
+        ]
+
 
 class TestCmdLint:
     def test_returns_one_when_no_tools(self, check_lint, tmp_tex_dir):
@@ -179,3 +179,38 @@ class TestCLIArgumentParsing:
         monkeypatch.setattr("sys.argv", ["build.py", "nonexistent-cmd"])
         with pytest.raises(SystemExit):
             cli_main()
+
+    def test_available_cpus_uses_affinity(self, monkeypatch):
+        """Default job count follows the CPU affinity mask, not cpu_count."""
+        from buildlib.cli import _available_cpus
+
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+        monkeypatch.setattr(os, "cpu_count", lambda: 64)
+        assert _available_cpus() == 2
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["build"], "build"),
+            (["--mode", "prod", "-j", "2", "build-example", "thesis"], "build-example"),
+            (["--cnf-line", "build", "lint"], "lint"),
+            (["--verbose", "--jobs=3", "clean"], "clean"),
+            (["--help"], None),
+            (["no-such-command"], None),
+            ([], None),
+        ],
+    )
+    def test_requested_command(self, argv, expected):
+        """Only an unambiguous subcommand narrows the parser."""
+        from buildlib.cli import _requested_command
+
+        assert _requested_command(argv) == expected
+
+    def test_single_subparser_parses_like_full_parser(self):
+        """Building one subparser yields the same namespace as the full parser."""
+        from buildlib.cli import _create_parser
+
+        argv = ["--mode", "prod", "diff", "-o", "out.pdf", "a.pdf", "b.pdf"]
+        full = _create_parser(4).parse_args(argv)
+        single = _create_parser(4, only="diff").parse_args(argv)
+        assert vars(single) == vars(full)
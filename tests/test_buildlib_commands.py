@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -67,11 +68,43 @@ class TestCheckAllLatexPackages:
 
 
 class TestCmdPreflight:
-    def test_preflight_runs(self, commands, capsys):
+    def test_preflight_runs(self, commands, capsys, tmp_path):
+        commands.config = ProjectConfig(build_dir=tmp_path / "build")
         commands.cmd_preflight()
         captured = capsys.readouterr()
         assert len(captured.out) > 0
 
+    def test_passing_result_is_reused(self, commands, tmp_path, capsys):
+        commands.config = ProjectConfig(build_dir=tmp_path / "build")
+        all_found = lambda pkgs: dict.fromkeys(pkgs, True)  # noqa: E731
+        with patch.object(
+            commands, "_check_tool", return_value=("tool", True, "ok")
+        ), patch.object(
+            commands, "_get_texlive_version", return_value=2025
+        ) as tex, patch.object(
+            commands, "_check_all_latex_packages", side_effect=all_found
+        ):
+            commands.cmd_preflight()
+            commands.cmd_preflight()
+        assert tex.call_count == 1
+        assert "(cached)" in capsys.readouterr().out
+
+    def test_failing_result_is_not_cached(self, commands, tmp_path):
+        commands.config = ProjectConfig(build_dir=tmp_path / "build")
+        with patch.object(commands, "_get_texlive_version", return_value=None):
+            commands.cmd_preflight()
+        assert not (tmp_path / "build" / "preflight_cache.json").exists()
+
+    def test_cache_is_anchored_at_repo_root(self, commands, tmp_path, monkeypatch):
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path / "sub")
+        commands.config = ProjectConfig(build_dir=Path("build"))
+        commands._save_preflight_cache("fp", 3)
+        assert (tmp_path / "build" / "preflight_cache.json").exists()
+        assert not (tmp_path / "sub" / "build").exists()
+        assert commands._load_preflight_cache("fp")["total"] == 3
+
 
 class TestCmdTest:
     def test_cmd_test_returns_int(self, commands):
@@ -691,13 +691,13 @@ class TestCmdCheck:
         (tmp_path / "main.tex").write_text("\\cite{x}\n", encoding="utf-8")
         bib = tmp_path / "broken.bib"
         bib.write_text("@article{x,author={A}}\n", encoding="utf-8")
-        with patch.object(Path, "read_text", side_effect=OSError("permission denied")):
+        with patch.object(Path, "read_bytes", side_effect=OSError("permission denied")):
             result = commands.cmd_check([str(tmp_path)])
         # Should not crash, result may be 0 or 1 depending on how the error is handled
 
     def test_tex_file_read_error(self, commands, capsys, tmp_path):
         (tmp_path / "main.tex").write_text("\\label{x}\n", encoding="utf-8")
-        with patch.object(Path, "read_text", side_effect=OSError("read error")):
+        with patch.object(Path, "read_bytes", side_effect=OSError("read error")):
             result = commands.cmd_check([str(tmp_path)])
         captured = capsys.readouterr()
         assert "Cannot read" in captured.out
@@ -1113,7 +1113,9 @@ class TestCmdWatch:
 # cmd_preflight
 # ---------------------------------------------------------------------------
 class TestCmdPreflightExtended:
-    def test_preflight_with_texlive(self, commands, capsys):
+    def test_preflight_with_texlive(self, commands, capsys, tmp_path):
+        commands.config = ProjectConfig(build_dir=tmp_path / "build")
+
         def fake_which(tool):
             if tool in ("lualatex", "latexmk", "git"):
                 return f"/usr/bin/{tool}"
@@ -1139,7 +1141,9 @@ class TestCmdPreflightExtended:
         captured = capsys.readouterr()
         assert "2024" in captured.out
 
-    def test_preflight_no_texlive(self, commands, capsys):
+    def test_preflight_no_texlive(self, commands, capsys, tmp_path):
+        commands.config = ProjectConfig(build_dir=tmp_path / "build")
+
         def fake_which(tool):
             return (
                 f"/usr/bin/{tool}" if tool in ("lualatex", "latexmk", "git") else None
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from buildlib.config import (
     BUILD_EXAMPLES_SUBDIR,
@@ -15,6 +18,8 @@ from buildlib.config import (
     REPO_ROOT,
     SVG_INKSCAPE_CACHE,
     ProjectConfig,
+    copy_file,
+    find_example_dirs,
 )
 
 
@@ -112,3 +117,43 @@ class TestProjectConfig:
         for val in ["0", "false", "no", "False", "NO", ""]:
             monkeypatch.setenv("OMNILATEX_VERBOSE", val)
             assert config.verbose_enabled() is False
+
+
+class TestFindExampleDirs:
+    """Test find_example_dirs example discovery."""
+
+    def test_only_dirs_with_main_tex(self, tmp_path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / MAIN_TEX_FILENAME).write_text("")
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / MAIN_TEX_FILENAME).write_text("")
+        (tmp_path / "no-main").mkdir()
+        (tmp_path / "stray.tex").write_text("")
+        assert find_example_dirs(tmp_path) == [tmp_path / "a", tmp_path / "b"]
+
+    def test_missing_dir(self, tmp_path):
+        assert find_example_dirs(tmp_path / "missing") == []
+
+    def test_repo_examples_discovered(self):
+        found = find_example_dirs(REPO_ROOT / "examples")
+        assert found
+        assert all((p / MAIN_TEX_FILENAME).is_file() for p in found)
+
+
+class TestCopyFile:
+    def test_copies_contents(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        copy_file(src, tmp_path / "b.pdf")
+        assert (tmp_path / "b.pdf").read_bytes() == b"%PDF-1.4 data"
+
+    def test_falls_back_when_reflink_unsupported(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 data")
+        with patch("fcntl.ioctl", side_effect=OSError(95, "not supported")):
+            copy_file(src, tmp_path / "b.pdf")
+        assert (tmp_path / "b.pdf").read_bytes() == b"%PDF-1.4 data"
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            copy_file(tmp_path / "missing.pdf", tmp_path / "b.pdf")
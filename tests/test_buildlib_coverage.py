@@ -151,6 +151,18 @@ class TestGetSourceFiles:
         files2 = build_core._get_source_files(REPO_ROOT)
         assert files1 is files2
 
+    def test_excluded_dirs_pruned(self, build_core, tmp_path):
+        (tmp_path / "tex").mkdir()
+        (tmp_path / "tex" / "a.sty").write_text("", encoding="utf-8")
+        (tmp_path / "b.cls").write_text("", encoding="utf-8")
+        for skipped in ("build", ".git", "node_modules"):
+            (tmp_path / skipped).mkdir()
+            (tmp_path / skipped / "c.sty").write_text("", encoding="utf-8")
+        assert build_core._get_source_files(tmp_path) == [
+            tmp_path / "b.cls",
+            tmp_path / "tex" / "a.sty",
+        ]
+
 
 # ===================================================================
 # builder.py -- cmd_cache_stats
@@ -593,6 +605,39 @@ class TestHashForPathsExtended:
         h2 = _BuildCore._hash_for_paths([b, a])
         assert h1 == h2
 
+    def test_streamed_digest_matches_framed_contents(self, tmp_path, monkeypatch):
+        import hashlib
+
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        monkeypatch.setattr("buildlib.mixins.cache.HASH_CHUNK_SIZE", 7)
+        a = tmp_path / "a.png"
+        b = tmp_path / "b.tex"
+        a.write_bytes(bytes(range(256)) * 3)
+        b.write_bytes(b"short")
+        expected = hashlib.sha256(
+            b"a.png\x00768\x00" + a.read_bytes() + b"b.tex\x005\x00" + b"short"
+        ).hexdigest()
+        assert _BuildCore._hash_for_paths([b, a]) == expected
+
+    def test_rename_changes_hash(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        a = tmp_path / "fig.pdf"
+        a.write_bytes(b"%PDF-1.5")
+        h1 = _BuildCore._hash_for_paths([a])
+        b = a.rename(tmp_path / "figure.pdf")
+        assert _BuildCore._hash_for_paths([b]) != h1
+
+    def test_moving_bytes_between_files_changes_hash(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        a = tmp_path / "a.tex"
+        b = tmp_path / "b.tex"
+        a.write_bytes(b"ab")
+        b.write_bytes(b"c")
+        h1 = _BuildCore._hash_for_paths([a, b])
+        a.write_bytes(b"a")
+        b.write_bytes(b"bc")
+        assert _BuildCore._hash_for_paths([a, b]) != h1
+
 
 # ===================================================================
 # builder.py -- _compile_example_worker with cache hit
@@ -661,6 +706,29 @@ class TestCleanMethods:
             build_core.clean_example(["test-ex"])
         mock_run.assert_called_once()
 
+    def test_clean_example_runs_each_example(self, build_core, tmp_path, monkeypatch):
+        """clean_example should run latexmk -c once in every example dir."""
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        build_core.jobs = 4
+        names = [f"ex{i}" for i in range(6)]
+        with patch.object(build_core.runner, "run", return_value=(0, [])) as mock_run:
+            build_core.clean_example(names)
+        cwds = sorted(call.kwargs["cwd"] for call in mock_run.call_args_list)
+        assert cwds == [tmp_path / "examples" / n for n in names]
+
+    def test_clean_example_skips_clean_dirs(self, build_core, tmp_path, monkeypatch):
+        """latexmk -c only runs where there are auxiliary files to remove."""
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        for name, extra in [("clean", "main.pdf"), ("dirty", "main.aux")]:
+            ex = tmp_path / "examples" / name
+            ex.mkdir(parents=True)
+            (ex / "main.tex").write_text("", encoding="utf-8")
+            (ex / extra).write_text("", encoding="utf-8")
+        with patch.object(build_core.runner, "run", return_value=(0, [])) as mock_run:
+            build_core.clean_example(["clean", "dirty"])
+        mock_run.assert_called_once()
+        assert mock_run.call_args.kwargs["cwd"] == tmp_path / "examples" / "dirty"
+
     def test_clean_example_os_error(self, build_core, tmp_path, monkeypatch, capsys):
         """clean_example should catch OSError and continue."""
         monkeypatch.chdir(tmp_path)
@@ -689,6 +757,29 @@ class TestCleanMethods:
         assert not (examples_dir / "main.pdf").exists()
         assert (tmp_path / "other.pdf").exists()
 
+    def test_clean_pdf_without_build_dir(
+        self, build_core, tmp_path, monkeypatch, capsys
+    ):
+        """clean_pdf should succeed when nothing has been built yet."""
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        build_core.config.build_dir = tmp_path / "missing"
+        build_core.clean_pdf()
+        assert "Removed 0 PDF(s)." in capsys.readouterr().out
+
+    def test_clean_pdf_nested_example_dirs(
+        self, build_core, tmp_path, monkeypatch, capsys
+    ):
+        monkeypatch.setattr("buildlib.config.REPO_ROOT", tmp_path)
+        build_core.config.build_dir = tmp_path / "build"
+        nested = tmp_path / "examples" / "ex1" / "svg-inkscape"
+        nested.mkdir(parents=True)
+        (nested / "fig.pdf").write_bytes(b"%PDF")
+        (nested / "fig.pdf_tex").write_text("", encoding="utf-8")
+        build_core.clean_pdf()
+        assert not (nested / "fig.pdf").exists()
+        assert (nested / "fig.pdf_tex").exists()
+        assert "Removed 1 PDF(s)." in capsys.readouterr().out
+
 
 # ===================================================================
 # builder.py -- build_all, build_example
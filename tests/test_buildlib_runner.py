@@ -70,6 +70,12 @@ class TestCommandRunner:
         assert exit_code == 0
         assert any("test_value" in line for line in logs)
 
+    def test_extra_env_does_not_leak_into_base_env(self, runner):
+        runner.run(["true"], extra_env={"CUSTOM_VAR": "test_value"})
+        exit_code, logs = runner.run(["printenv", "CUSTOM_VAR"])
+        assert exit_code == 1
+        assert "CUSTOM_VAR" not in runner._base_env
+
     def test_run_callback_receives_lines(self, runner):
         received_lines = []
         exit_code, logs = runner.run(
@@ -79,6 +85,14 @@ class TestCommandRunner:
         assert exit_code == 0
         assert any("callback_test" in line for line in received_lines)
 
+    def test_run_keeps_only_log_tail(self, runner, monkeypatch):
+        monkeypatch.setattr(runner, "LOG_TAIL_LINES", 3)
+        received = []
+        exit_code, logs = runner.run(["seq", "1", "10"], on_line=received.append)
+        assert exit_code == 0
+        assert len(received) == 10
+        assert logs == ["[... 7 earlier line(s) omitted ...]", "8", "9", "10"]
+
     @pytest.mark.slow
     def test_run_timeout(self, runner):
         """Test timeout handling with a command that hangs.
@@ -102,3 +116,29 @@ class TestCommandRunner:
         """Test OSError handling for invalid command paths."""
         exit_code, logs = runner.run([""])
         assert exit_code == -1
+
+
+class TestRunGrep:
+    """Test CommandRunner.run_grep streaming search."""
+
+    def test_finds_needles(self, runner):
+        found = runner.run_grep(
+            ["printf", "alpha\\nbeta\\ngamma\\n"], [b"beta", b"delta"]
+        )
+        assert found == {b"beta"}
+
+    def test_ignore_case(self, runner):
+        found = runner.run_grep(["echo", "Libertinus Serif"], [b"libertinus serif"])
+        assert found == set()
+        found = runner.run_grep(
+            ["echo", "Libertinus Serif"], [b"libertinus serif"], ignore_case=True
+        )
+        assert found == {b"libertinus serif"}
+
+    def test_stops_once_all_needles_found(self, runner):
+        # `yes` never exits on its own; run_grep must terminate it.
+        found = runner.run_grep(["yes", "needle"], [b"needle"], timeout=5)
+        assert found == {b"needle"}
+
+    def test_command_not_found(self, runner):
+        assert runner.run_grep(["nonexistent_command_xyz_12345"], [b"x"]) == set()
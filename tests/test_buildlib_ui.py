@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from buildlib.ui import TerminalOutput
+from buildlib.ui import BufferedOutput, TerminalOutput
 
 
 class TestTerminalOutput:
@@ -73,3 +73,65 @@ class TestTerminalOutput:
         assert "\033[1m" in captured.out  # bold
         assert "\033[94m" in captured.out  # blue
         assert "Colored Header" in captured.out
+
+    def test_concurrent_writes_do_not_interleave(self, capsys):
+        """Messages logged from worker threads stay on their own lines."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        ui = TerminalOutput(use_color=False)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for i in range(200):
+                pool.submit(ui.info, f"worker message {i}")
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 200
+        assert all(line.startswith("[INFO] worker message ") for line in lines)
+
+    def test_ascii_symbols(self, capsys):
+        ui = TerminalOutput(use_color=False, use_unicode=False)
+        ui.success("done")
+        ui.warning("hmm")
+        assert capsys.readouterr().out == "[[OK]] done\n[[WARN]] hmm\n"
+
+    def test_palette_not_shared_between_instances(self):
+        plain = TerminalOutput(use_color=False)
+        colored = TerminalOutput(use_color=True)
+        assert plain.green == ""
+        assert colored.green == "\033[92m"
+
+    def test_one_write_per_message(self, monkeypatch):
+        import io
+        import sys
+
+        writes: list[str] = []
+        stream = io.StringIO()
+        stream.write = writes.append
+        monkeypatch.setattr(sys, "stdout", stream)
+        ui = TerminalOutput(use_color=False)
+        ui.info("a")
+        ui.debug("b")
+        ui.flush()
+        assert writes == ["[INFO] a\n", "[DEBUG] b\n"]
+
+    def test_non_str_message(self, capsys, tmp_path):
+        ui = TerminalOutput(use_color=False)
+        ui.info(tmp_path)
+        ui.warning(ValueError("bad"))
+        assert capsys.readouterr().out == f"[INFO] {tmp_path}\n[⚠] bad\n"
+
+
+class TestBufferedOutput:
+    def test_holds_messages_until_replay(self, capsys):
+        ui = TerminalOutput(use_color=False, use_unicode=False)
+        buffered = BufferedOutput(ui)
+        buffered.header("Root")
+        buffered.plain("raw log line")
+        buffered.error("failed")
+        assert capsys.readouterr() == ("", "")
+
+        buffered.replay()
+        captured = capsys.readouterr()
+        assert captured.out == "\n=== Root ===\nraw log line\n"
+        assert captured.err == "[[ERR]] failed\n"
+
+        buffered.replay()
+        assert capsys.readouterr() == ("", "")